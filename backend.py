@@ -1,38 +1,627 @@
 import os
+import re
 import json
 import random
+import struct
+import datetime
+import hashlib
+import unicodedata
+import threading
+from concurrent.futures import Future
 
+import numpy as np
 
-def load_vocab():
-    base = os.path.dirname(__file__)
-    path = os.path.join(base, 'data', 'vocabulary.json')
+WORD_LEN = 5
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+N_PATTERNS = 3 ** WORD_LEN
+CACHE_DIR = os.path.join(os.path.dirname(__file__), 'data', '.cache')
+
+# number of guess x answer cells scored per chunk in evaluate_batch
+_BATCH_CELLS = 1 << 22
+
+
+VOCAB_PATH = os.path.join(os.path.dirname(__file__), 'data', 'vocabulary.json')
+COMPILED_VOCAB_PATH = os.path.join(CACHE_DIR, 'vocabulary.bin')
+PACKS_DIR = os.path.join(os.path.dirname(__file__), 'data', 'packs')
+DEFAULT_PACK = "en"
+MIN_WORD_LEN, MAX_WORD_LEN = 4, 8
+
+# compiled vocabulary: header followed by `count` fixed-width ASCII records
+_VOCAB_MAGIC = b"WDLV"
+_VOCAB_VERSION = 1
+_VOCAB_HEADER = struct.Struct("<4sHHIqq20s")  # magic, version, word length, count, mtime_ns, size, sha1
+
+
+# common entries ("word", or "word": number) matched in one go; anything else goes through the decoder
+_SIMPLE_ENTRY = {
+    "[": re.compile(r'[\s,]*"([^"\\]*)"\s*(?=[,\]])'),
+    "{": re.compile(r'[\s,]*"([^"\\]*)"\s*:\s*-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\s*(?=[,}])'),
+}
+
+
+def iter_json_words(f, chunk_size=1 << 16):
+    """Yield the strings of a top-level JSON array, or the keys of a top-level object.
+
+    ``f`` is read ``chunk_size`` characters at a time and only the element
+    being decoded is kept in memory, so large lists stream through.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def more():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buf = buf[pos:] + chunk
+        pos = 0
+        return not eof
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or not more():
+                return
+
+    def value():
+        nonlocal pos
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not more():
+                    raise
+                continue
+            # a number cut off by the end of the buffer may continue in the next chunk
+            if (isinstance(item, (int, float)) and not eof
+                    and (end == len(buf) or buf[end] in "0123456789.eE+-") and more()):
+                continue
+            pos = end
+            return item
+
+    skip_ws()
+    if pos >= len(buf):
+        return
+    opener = buf[pos]
+    if opener not in "[{":
+        raise ValueError("expected a JSON array or object")
+    closer = "]" if opener == "[" else "}"
+    simple = _SIMPLE_ENTRY[opener].match
+    pos += 1
+    while True:
+        m = simple(buf, pos)
+        if m:
+            pos = m.end()
+            yield m.group(1)
+            continue
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError("unexpected end of JSON")
+        if buf[pos] == closer:
+            return
+        if buf[pos] == ",":
+            pos += 1
+            continue
+        item = value()
+        if opener == "{":
+            skip_ws()
+            if pos >= len(buf) or buf[pos] != ":":
+                raise ValueError("expected ':' after an object key")
+            pos += 1
+            skip_ws()
+            value()
+        if isinstance(item, str):
+            yield item
+
+
+def iter_line_words(f):
+    """Yield one word per non-empty line, skipping ``#`` comments."""
+    for line in f:
+        word = line.strip()
+        if word and not word.startswith("#"):
+            yield word
+
+
+def normalize_word(word, length=WORD_LEN):
+    """Lower-case ``word`` and fold accents away; None unless that leaves ``length`` letters a-z."""
+    word = word.strip().lower()
+    if not word.isascii():
+        word = "".join(c for c in unicodedata.normalize("NFKD", word) if not unicodedata.combining(c))
+    if len(word) != length or not word.isascii() or not word.isalpha():
+        return None
+    return word
+
+
+def parse_vocab(path=VOCAB_PATH, length=WORD_LEN):
+    """Words of ``length`` letters from a JSON list/object or a plain text file with one word per line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        words = iter_json_words(f) if path.endswith(".json") else iter_line_words(f)
+        try:
+            found = {n for n in (normalize_word(w, length) for w in words) if n}
+        except ValueError as exc:
+            raise RuntimeError(f"Unexpected vocabulary format in {path}: {exc}") from None
+    if not found:
+        raise RuntimeError(f"No valid {length}-letter words found in {path}")
+    return sorted(found)
+
+
+def compile_vocab(words, stat, out=COMPILED_VOCAB_PATH, length=WORD_LEN):
+    header = _VOCAB_HEADER.pack(_VOCAB_MAGIC, _VOCAB_VERSION, length, len(words),
+                                stat.st_mtime_ns, stat.st_size, bytes.fromhex(vocab_hash(words)))
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    tmp = f"{out}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(header)
+        f.write("".join(words).encode('ascii'))
+    os.replace(tmp, out)
+
+
+def load_compiled_vocab(stat, path=COMPILED_VOCAB_PATH, length=WORD_LEN):
+    """Return the compiled word list, or None when it is missing or stale."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(_VOCAB_HEADER.size)
+    except OSError:
+        return None
+    if len(header) != _VOCAB_HEADER.size:
+        return None
+    magic, version, stored_length, count, mtime_ns, size, digest = _VOCAB_HEADER.unpack(header)
+    if (magic, version, stored_length) != (_VOCAB_MAGIC, _VOCAB_VERSION, length):
+        return None
+    if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+        return None
+    if os.path.getsize(path) != _VOCAB_HEADER.size + count * length:
+        return None
+    records = np.memmap(path, dtype=np.uint8, mode='r', offset=_VOCAB_HEADER.size, shape=(count, length))
+    raw = records.tobytes().decode('ascii')
+    words = [raw[i:i + length] for i in range(0, len(raw), length)]
+    if bytes.fromhex(vocab_hash(words)) != digest:
+        return None
+    return words
+
+
+def load_words(path, compiled, length=WORD_LEN):
+    """Word list of ``path``, from its compiled copy at ``compiled`` while that is current."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"Required vocabulary file not found: {path}")
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    if isinstance(data, dict):
-        words = [w.lower() for w in data.keys() if isinstance(w, str) and len(w) == 5 and w.isalpha()]
-    elif isinstance(data, list):
-        words = [w.lower() for w in data if isinstance(w, str) and len(w) == 5 and w.isalpha()]
-    else:
-        raise RuntimeError(f"Unexpected vocabulary format in {path}")
-    if not words:
-        raise RuntimeError(f"No valid 5-letter words found in {path}")
-    return sorted(set(words))
+    stat = os.stat(path)
+    words = load_compiled_vocab(stat, compiled, length)
+    if words is not None:
+        return words
+    words = parse_vocab(path, length)
+    try:
+        compile_vocab(words, stat, compiled, length)
+    except OSError:
+        pass
+    return words
+
+
+def load_vocab():
+    return load_words(VOCAB_PATH, COMPILED_VOCAB_PATH)
 
 
 _VOCAB_CACHE = None
+_VOCAB_STAMP = None
+
+
+def _vocab_stamp():
+    try:
+        stat = os.stat(VOCAB_PATH)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 def get_vocab(reload: bool = False):
-    global _VOCAB_CACHE
+    global _VOCAB_CACHE, _VOCAB_STAMP
+    if _VOCAB_CACHE is not None and reload:
+        # reloading is free unless the source file changed on disk
+        reload = _vocab_stamp() != _VOCAB_STAMP
     if reload or _VOCAB_CACHE is None:
+        _VOCAB_STAMP = _vocab_stamp()
         _VOCAB_CACHE = load_vocab()
     return _VOCAB_CACHE
 
 
-def pick_daily_word(vocab):
-    return random.choice(vocab)
+class Vocabulary:
+    """Immutable word list shared by the game, solver and tools.
+
+    Offers O(1) membership and index lookups plus a prefix trie stored
+    breadth-first: each node keeps the string of its child letters and the
+    id of its first child, so children are contiguous and a lookup is one
+    ``str.find`` per letter.
+    """
+
+    __slots__ = ('words', 'codes', 'letters', '_index', '_labels', '_first')
+
+    def __init__(self, words):
+        words = tuple(sorted(set(w.lower() for w in words)))
+        labels, first = _build_trie(words)
+        object.__setattr__(self, 'words', words)
+        object.__setattr__(self, 'codes', encode_words(words))
+        object.__setattr__(self, '_index', {w: i for i, w in enumerate(words)})
+        object.__setattr__(self, '_labels', labels)
+        object.__setattr__(self, '_first', first)
+        self.codes.flags.writeable = False
+        object.__setattr__(self, 'letters', LetterIndex(self.codes))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Vocabulary is immutable")
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __getitem__(self, i):
+        return self.words[i]
+
+    def __contains__(self, word):
+        return word in self._index
+
+    def index_of(self, word):
+        return self._index.get(word)
+
+    def _node(self, prefix):
+        node = 0
+        for ch in prefix:
+            k = self._labels[node].find(ch)
+            if k < 0:
+                return None
+            node = self._first[node] + k
+        return node
+
+    def has_prefix(self, prefix):
+        return self._node(prefix.lower()) is not None
+
+    def next_letters(self, prefix):
+        node = self._node(prefix.lower())
+        return "" if node is None else self._labels[node]
+
+
+def _bitset(mask):
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+
+class LetterIndex:
+    """Bitsets over vocabulary indices for constraint queries.
+
+    Bit ``i`` of ``position[p][c]`` is set when word ``i`` has letter ``c``
+    at position ``p``; ``at_least[c][k]`` when it has ``k`` or more copies of
+    ``c``.  Matching a ``Constraints`` is then a handful of integer ANDs.
+    """
+
+    def __init__(self, codes):
+        n, length = codes.shape
+        self.size = n
+        self.all = (1 << n) - 1
+        self.position = [[_bitset(codes[:, p] == c) for c in range(len(ALPHABET))] for p in range(length)]
+        counts = np.zeros((n, len(ALPHABET)), dtype=np.uint8)
+        for p in range(length):
+            counts[np.arange(n), codes[:, p]] += 1
+        self.at_least = [[self.all] + [_bitset(counts[:, c] >= k) for k in range(1, length + 1)]
+                         for c in range(len(ALPHABET))]
+
+    def letter(self, p, ch):
+        return self.position[p][ord(ch) - 97]
+
+    def matching(self, constraints, mask=None):
+        mask = self.all if mask is None else mask
+        for p, ch in constraints.greens.items():
+            mask &= self.position[p][ord(ch) - 97]
+        for p, banned in enumerate(constraints.banned):
+            for ch in banned:
+                mask &= ~self.position[p][ord(ch) - 97]
+        for ch, k in constraints.min_counts.items():
+            mask &= self.at_least[ord(ch) - 97][k]
+        for ch, k in constraints.max_counts.items():
+            if k + 1 < len(self.at_least[0]):
+                mask &= ~self.at_least[ord(ch) - 97][k + 1]
+        return mask
+
+    def count(self, constraints, mask=None):
+        return self.matching(constraints, mask).bit_count()
+
+    def indices(self, mask):
+        bits = np.frombuffer(mask.to_bytes((self.size + 7) // 8, 'little'), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(bits, bitorder='little')[:self.size])
+
+
+class Constraints:
+    """Everything the feedback so far reveals about the answer."""
+
+    def __init__(self, length: int = WORD_LEN):
+        self.greens = {}
+        self.banned = [set() for _ in range(length)]
+        self.min_counts = {}
+        self.max_counts = {}
+
+    def add(self, guess, states):
+        guess = guess.lower()
+        found = {}
+        for i, (ch, s) in enumerate(zip(guess, states)):
+            if s == 2:
+                self.greens[i] = ch
+            else:
+                self.banned[i].add(ch)
+            if s > 0:
+                found[ch] = found.get(ch, 0) + 1
+        for ch, s in zip(guess, states):
+            k = found.get(ch, 0)
+            if k > self.min_counts.get(ch, 0):
+                self.min_counts[ch] = k
+            if s == 0:
+                self.max_counts[ch] = min(k, self.max_counts.get(ch, k))
+
+    def allows(self, word):
+        word = word.lower()
+        if any(word[p] != ch for p, ch in self.greens.items()):
+            return False
+        if any(word[p] in banned for p, banned in enumerate(self.banned)):
+            return False
+        if any(word.count(ch) < k for ch, k in self.min_counts.items()):
+            return False
+        return all(word.count(ch) <= k for ch, k in self.max_counts.items())
+
+    def hard_mode_error(self, word):
+        """Return why ``word`` ignores a revealed hint, or None if it is allowed."""
+        word = word.lower()
+        for p, ch in sorted(self.greens.items()):
+            if word[p] != ch:
+                return f"{_ordinal(p + 1)} letter must be {ch.upper()}"
+        for ch, k in sorted(self.min_counts.items()):
+            if word.count(ch) < k:
+                return f"Guess must contain {ch.upper()}"
+        return None
+
+    def hard_mode_mask(self, codes):
+        """Boolean array of the words (rows of letter codes) ``hard_mode_error`` accepts."""
+        ok = np.ones(len(codes), dtype=bool)
+        for p, ch in self.greens.items():
+            ok &= codes[:, p] == ord(ch) - ord('a')
+        for ch, k in self.min_counts.items():
+            ok &= (codes == ord(ch) - ord('a')).sum(axis=1) >= k
+        return ok
+
+
+def _ordinal(n):
+    return f"{n}{'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')}"
+
+
+def _build_trie(words):
+    depth = max((len(w) for w in words), default=0)
+    levels = [[""]] + [sorted({w[:d] for w in words if len(w) >= d}) for d in range(1, depth + 1)]
+    labels = []
+    first = []
+    next_id = 1
+    for d, level in enumerate(levels):
+        below = levels[d + 1] if d + 1 < len(levels) else []
+        j = 0
+        for prefix in level:
+            # children of consecutive prefixes are consecutive in the next level
+            while j < len(below) and below[j][:d] < prefix:
+                j += 1
+            start = j
+            while j < len(below) and below[j][:d] == prefix:
+                j += 1
+            labels.append("".join(p[d] for p in below[start:j]))
+            first.append(next_id + start)
+        next_id += len(below)
+    return labels, first
+
+
+_VOCABULARY = None
+
+
+def get_vocabulary(reload: bool = False):
+    global _VOCABULARY
+    words = get_vocab(reload)
+    if _VOCABULARY is None or _VOCABULARY[0] is not words:
+        _VOCABULARY = (words, Vocabulary(words))
+    return _VOCABULARY[1]
+
+
+class WordPack:
+    """A word list on disk: allowed guesses plus an optional, separate answer list.
+
+    Only the small manifest is read up front; each list is parsed (or read
+    from its compiled copy in the cache) the first time it is asked for.
+    """
+
+    def __init__(self, name, allowed, answers=None, length=WORD_LEN, language="en"):
+        if not MIN_WORD_LEN <= length <= MAX_WORD_LEN:
+            raise ValueError(f"Word pack {name!r}: length must be {MIN_WORD_LEN}-{MAX_WORD_LEN}, not {length}")
+        self.name = name
+        self.allowed_path = allowed
+        self.answers_path = answers
+        self.length = length
+        self.language = language
+        self._vocabulary = None
+        self._answers = None
+
+    def __repr__(self):
+        return f"WordPack({self.name!r}, language={self.language!r}, length={self.length})"
+
+    def _load(self, path, kind):
+        compiled = os.path.join(CACHE_DIR, f"pack-{self.name}-{kind}.bin")
+        return load_words(path, compiled, self.length)
+
+    def vocabulary(self, reload=False):
+        """Every word accepted as a guess, answers included."""
+        if self.allowed_path == VOCAB_PATH:
+            return get_vocabulary(reload)
+        if self._vocabulary is None:
+            words = self._load(self.allowed_path, "allowed")
+            if self.answers_path:
+                words = list(words) + list(self.answer_words())
+            self._vocabulary = Vocabulary(words)
+        return self._vocabulary
+
+    def answer_words(self):
+        """Words that can be picked as answers; the allowed list unless the pack has its own."""
+        if not self.answers_path:
+            return self.vocabulary().words
+        if self._answers is None:
+            self._answers = tuple(self._load(self.answers_path, "answers"))
+        return self._answers
+
+
+_PACKS = None
+
+
+def list_packs(packs_dir=None):
+    """Name -> WordPack for the bundled list and every ``<packs_dir>/<name>/pack.json`` manifest.
+
+    A manifest looks like ``{"language": "es", "length": 5, "allowed":
+    "allowed.txt", "answers": "answers.json"}`` with paths relative to its
+    directory; ``answers`` is optional.
+    """
+    global _PACKS
+    if packs_dir is None and _PACKS is not None:
+        return _PACKS
+    packs = {DEFAULT_PACK: WordPack(DEFAULT_PACK, VOCAB_PATH)}
+    root = packs_dir or PACKS_DIR
+    for name in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+        manifest = os.path.join(root, name, "pack.json")
+        if not os.path.isfile(manifest):
+            continue
+        with open(manifest, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        answers = meta.get("answers")
+        packs[name] = WordPack(
+            name,
+            os.path.join(root, name, meta["allowed"]),
+            os.path.join(root, name, answers) if answers else None,
+            length=int(meta.get("length", WORD_LEN)),
+            language=meta.get("language", name),
+        )
+    if packs_dir is None:
+        _PACKS = packs
+    return packs
+
+
+def get_pack(name=None):
+    packs = list_packs()
+    name = name or DEFAULT_PACK
+    if name not in packs:
+        raise KeyError(f"Unknown word pack {name!r}; available: {', '.join(packs)}")
+    return packs[name]
+
+
+def load_vocabulary_async(pack=None):
+    """Start loading a pack's vocabulary on a daemon thread and return a Future for it."""
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(get_pack(pack).vocabulary())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="vocabulary-loader", daemon=True).start()
+    return future
+
+
+def pick_daily_word(vocab, rng=None, day=None):
+    if day is not None:
+        return answer_for_day(vocab, day)
+    return (rng or random).choice(vocab)
+
+
+SCHEDULE_EPOCH = datetime.date(2021, 6, 19)
+_SCHEDULES = {}
+
+
+def day_number(date=None):
+    return ((date or datetime.date.today()) - SCHEDULE_EPOCH).days
+
+
+def answer_schedule(vocab):
+    """Fixed shuffle of the word list; day ``n`` plays entry ``n % len``."""
+    key = vocab_hash(vocab)
+    order = _SCHEDULES.get(key)
+    if order is None:
+        order = list(range(len(vocab)))
+        random.Random(key).shuffle(order)
+        _SCHEDULES[key] = order
+    return order
+
+
+def answer_for_day(vocab, day):
+    order = answer_schedule(vocab)
+    return vocab[order[day % len(order)]]
+
+
+def encode_words(words):
+    if isinstance(words, str):
+        words = [words]
+    words = list(words)
+    if not words:
+        return np.zeros((0, WORD_LEN), dtype=np.uint8)
+    length = len(words[0])
+    if any(len(w) != length for w in words):
+        raise ValueError("All words must have the same length")
+    raw = np.frombuffer("".join(words).lower().encode('ascii'), dtype=np.uint8)
+    return (raw - ord('a')).reshape(len(words), length)
+
+
+def decode_words(codes):
+    codes = np.asarray(codes, dtype=np.uint8)
+    if codes.ndim == 1:
+        codes = codes.reshape(1, -1)
+    raw = (codes + ord('a')).tobytes().decode('ascii')
+    n = codes.shape[1]
+    return [raw[i:i + n] for i in range(0, len(raw), n)]
+
+
+def pattern_code(states):
+    code = 0
+    for i, s in enumerate(states):
+        code += int(s) * 3 ** i
+    return code
+
+
+def decode_pattern(code, length: int = WORD_LEN):
+    res = []
+    code = int(code)
+    for _ in range(length):
+        res.append(code % 3)
+        code //= 3
+    return res
+
+
+def _as_codes(words):
+    if isinstance(words, np.ndarray):
+        return words.reshape(1, -1) if words.ndim == 1 else words
+    return encode_words(words)
+
+
+def _score_block(guesses, answers, answer_counts):
+    # guesses: (n, L), answers: (m, L), answer_counts: (26, m) letter counts per answer
+    n, length = guesses.shape
+    m = answers.shape[0]
+    dtype = np.uint8 if 3 ** length <= 256 else np.uint16
+    green = [guesses[:, i, None] == answers[None, :, i] for i in range(length)]
+    codes = np.zeros((n, m), dtype=dtype)
+    for i in range(length):
+        gi = guesses[:, i]
+        # a non-green letter is yellow when the answer still has a copy of it left
+        # after the earlier occurrences in the guess and the later greens are served
+        used = (guesses[:, :i] == gi[:, None]).sum(axis=1, dtype=np.uint8)[:, None]
+        for j in range(i + 1, length):
+            same = guesses[:, j] == gi
+            if same.any():
+                used = used + (green[j] & same[:, None])
+        yellow = answer_counts[gi] > used
+        yellow &= ~green[i]
+        weight = dtype(3 ** i)
+        codes += yellow.view(np.uint8) * weight
+        codes += green[i].view(np.uint8) * (2 * weight)
+    return codes
 
 
 class Judge:
@@ -52,3 +641,79 @@ class Judge:
                 res[i] = 1
                 remaining[g] -= 1
         return res
+
+    @staticmethod
+    def evaluate_batch(guesses, answers):
+        """Score every guess against every answer.
+
+        Both arguments may be a word, a sequence of words or a 2-D array of
+        letter codes (see ``encode_words``).  Returns a ``(len(guesses),
+        len(answers))`` array of base-3 pattern codes where position ``i``
+        contributes ``state * 3 ** i`` (0 = absent, 1 = present, 2 = correct).
+        """
+        g = _as_codes(guesses)
+        a = _as_codes(answers)
+        if g.shape[1] != a.shape[1]:
+            raise ValueError("Guesses and answers must have the same length")
+        length = g.shape[1]
+        columns = np.arange(a.shape[0])
+        answer_counts = np.zeros((len(ALPHABET), a.shape[0]), dtype=np.uint8)
+        for i in range(length):
+            answer_counts[a[:, i], columns] += 1
+        dtype = np.uint8 if 3 ** length <= 256 else np.uint16
+        out = np.empty((g.shape[0], a.shape[0]), dtype=dtype)
+        step = max(1, _BATCH_CELLS // max(1, a.shape[0]))
+        for start in range(0, g.shape[0], step):
+            stop = start + step
+            out[start:stop] = _score_block(g[start:stop], a, answer_counts)
+        return out
+
+
+def vocab_hash(words):
+    return hashlib.sha1("".join(w + "\n" for w in words).encode('utf-8')).hexdigest()
+
+
+def _pattern_path(words, cache_dir=None):
+    cache_dir = cache_dir or CACHE_DIR
+    bits = _pattern_dtype(words).itemsize * 8
+    return os.path.join(cache_dir, f"patterns-{vocab_hash(words)[:16]}.u{bits}")
+
+
+def _pattern_dtype(words):
+    return np.dtype(np.uint8 if 3 ** len(words[0]) <= 256 else np.uint16)
+
+
+def load_pattern_matrix(words=None, cache_dir=None):
+    words = get_vocab() if words is None else words
+    path = _pattern_path(words, cache_dir)
+    n = len(words)
+    dtype = _pattern_dtype(words)
+    if not os.path.exists(path) or os.path.getsize(path) != n * n * dtype.itemsize:
+        return None
+    return np.memmap(path, dtype=dtype, mode='r', shape=(n, n))
+
+
+def build_pattern_matrix(words=None, cache_dir=None):
+    """Precompute the guess x answer pattern table and store it on disk.
+
+    The table is a raw ``uint8`` file named after the vocabulary hash, so a
+    changed word list gets a new file and an unchanged one is reused as a
+    read-only memory map.
+    """
+    words = get_vocab() if words is None else words
+    cached = load_pattern_matrix(words, cache_dir)
+    if cached is not None:
+        return cached
+    path = _pattern_path(words, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    n = len(words)
+    codes = encode_words(words)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    out = np.memmap(tmp, dtype=_pattern_dtype(words), mode='w+', shape=(n, n))
+    step = max(1, _BATCH_CELLS // max(1, n))
+    for start in range(0, n, step):
+        out[start:start + step] = Judge.evaluate_batch(codes[start:start + step], codes)
+    out.flush()
+    del out
+    os.replace(tmp, path)
+    return load_pattern_matrix(words, cache_dir)
@@ -0,0 +1,219 @@
+import sys
+import json
+import timeit
+import argparse
+import platform
+
+import numpy as np
+
+import backend
+import engine
+import solver
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register ``setup``; it returns the zero-argument callable that is timed."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("load_vocab.json")
+def _():
+    return backend.parse_vocab
+
+
+@benchmark("load_vocab.compiled")
+def _():
+    backend.load_vocab()
+    return backend.load_vocab
+
+
+@benchmark("get_vocab.cold")
+def _():
+    def cold():
+        backend._VOCAB_CACHE = None
+        return backend.get_vocab()
+    return cold
+
+
+@benchmark("get_vocab.cached")
+def _():
+    backend.get_vocab()
+    return backend.get_vocab
+
+
+@benchmark("get_vocab.reload")
+def _():
+    backend.get_vocab()
+    return lambda: backend.get_vocab(reload=True)
+
+
+@benchmark("vocabulary.build")
+def _():
+    words = backend.get_vocab()
+    return lambda: backend.Vocabulary(words)
+
+
+@benchmark("judge.evaluate.distinct")
+def _():
+    return lambda: backend.Judge.evaluate("crane", "slate")
+
+
+@benchmark("judge.evaluate.repeated")
+def _():
+    return lambda: backend.Judge.evaluate("geese", "eerie")
+
+
+@benchmark("judge.evaluate_batch.1xN")
+def _():
+    codes = backend.get_vocabulary().codes
+    return lambda: backend.Judge.evaluate_batch(codes[:1], codes)
+
+
+@benchmark("judge.evaluate_batch.1000x1000")
+def _():
+    codes = backend.get_vocabulary().codes
+    return lambda: backend.Judge.evaluate_batch(codes[:1000], codes[-1000:])
+
+
+@benchmark("vocabulary.contains")
+def _():
+    vocab = backend.get_vocabulary()
+    return lambda: ("crane" in vocab, "zzzzz" in vocab)
+
+
+@benchmark("vocabulary.has_prefix")
+def _():
+    vocab = backend.get_vocabulary()
+    return lambda: (vocab.has_prefix("cran"), vocab.has_prefix("xq"))
+
+
+@benchmark("letters.matching")
+def _():
+    vocab = backend.get_vocabulary()
+    constraints = backend.Constraints()
+    for guess in ("tares", "doily"):
+        constraints.add(guess, backend.Judge.evaluate(guess, "eerie"))
+    return lambda: vocab.letters.count(constraints)
+
+
+@benchmark("engine.multi.submit8")
+def _():
+    vocab = backend.get_vocabulary()
+    answers = [vocab[i] for i in range(0, len(vocab), len(vocab) // 8)][:8]
+    return lambda: engine.MultiGameState(answers, vocab).guess("tares")
+
+
+@benchmark("engine.adversarial.submit")
+def _():
+    vocab = backend.get_vocabulary()
+    return lambda: engine.AdversarialGameState(vocab).guess("tares")
+
+
+def _solver_after_first_guess():
+    s = solver.Solver(backend.get_vocabulary())
+    s.update("tares", backend.Judge.evaluate("tares", "chump"))
+    return s
+
+
+@benchmark("solver.update")
+def _():
+    s = solver.Solver(backend.get_vocabulary())
+    states = backend.Judge.evaluate("tares", "chump")
+
+    def update():
+        s.reset()
+        s.update("tares", states)
+    return update
+
+
+@benchmark("solver.suggest")
+def _():
+    s = _solver_after_first_guess()
+    return s.suggest
+
+
+def measure(fn, repeat=5, min_time=0.2):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names, repeat=5, min_time=0.2, out=sys.stdout):
+    results = {}
+    for name in names:
+        fn = BENCHMARKS[name]()
+        seconds = measure(fn, repeat, min_time)
+        results[name] = {"seconds": seconds}
+        print(f"{name:<32} {_fmt(seconds):>12}", file=out)
+    return results
+
+
+def compare(results, baseline, threshold, out=sys.stdout):
+    regressions = []
+    for name, res in sorted(results.items()):
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        ratio = res["seconds"] / base["seconds"]
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:<32} {_fmt(base['seconds']):>12} -> {_fmt(res['seconds']):>12} {ratio:6.2f}x {flag}", file=out)
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def _fmt(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def metadata():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks with JSON baselines")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail if slower than this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a result counts as a regression (default 0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    names = [n for n in BENCHMARKS if args.filter in n]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    results = run(names, args.repeat, args.min_time)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+from collections import namedtuple
+
+import numpy as np
+
+import backend
+
+ROWS = 6
+
+SubmitResult = namedtuple("SubmitResult", ["ok", "message", "states"])
+
+
+class GameState:
+    """Rules of one game without any rendering.
+
+    ``frontend.Game`` wraps this for the pygame window; simulations and the
+    server drive it directly. With a precomputed guess x answer ``patterns``
+    table, feedback is looked up instead of judged.
+    """
+
+    def __init__(self, answer, vocab, rows=ROWS, hard_mode=False, patterns=None):
+        if not isinstance(vocab, backend.Vocabulary):
+            vocab = backend.Vocabulary(vocab)
+        self.answer = answer.lower()
+        self.vocab = vocab
+        self.rows = rows
+        self.cols = len(self.answer)
+        self.hard_mode = hard_mode
+        self.patterns = patterns
+        self.answer_id = vocab.index_of(self.answer) if patterns is not None else None
+        self.row = 0
+        self.letters = []
+        self.guesses = []
+        self.win = False
+        self.lose = False
+        self.constraints = backend.Constraints(self.cols)
+        self.feedback_mask = vocab.letters.all
+
+    @property
+    def col(self):
+        return len(self.letters)
+
+    @property
+    def over(self):
+        return self.win or self.lose
+
+    @property
+    def typed(self):
+        return "".join(self.letters)
+
+    def add_char(self, ch):
+        if self.over or len(self.letters) >= self.cols or not ch.isalpha():
+            return False
+        self.letters.append(ch.lower())
+        return True
+
+    def backspace(self):
+        if self.over or not self.letters:
+            return False
+        self.letters.pop()
+        return True
+
+    def prefix_valid(self):
+        return self.vocab.has_prefix(self.typed)
+
+    def remaining(self, typed=""):
+        mask = self.feedback_mask
+        for i, ch in enumerate(typed):
+            mask &= self.vocab.letters.letter(i, ch)
+        return mask.bit_count()
+
+    def submit(self):
+        if self.over:
+            return SubmitResult(False, None, None)
+        if len(self.letters) < self.cols:
+            return SubmitResult(False, "Not enough letters", None)
+        guess = self.typed
+        if guess not in self.vocab:
+            return SubmitResult(False, "Not in word list", None)
+        if self.hard_mode:
+            error = self.constraints.hard_mode_error(guess)
+            if error:
+                return SubmitResult(False, error, None)
+        states = self.judge(guess)
+        self.guesses.append((guess, states))
+        self.constraints.add(guess, states)
+        self.feedback_mask = self.vocab.letters.matching(self.constraints)
+        if all(s == 2 for s in states):
+            self.win = True
+        else:
+            self.row += 1
+            self.letters = []
+            if self.rows is not None and self.row >= self.rows:
+                self.lose = True
+        return SubmitResult(True, None, states)
+
+    def judge(self, guess):
+        """Feedback states for a valid ``guess``."""
+        if self.answer_id is not None:
+            code = int(self.patterns[self.vocab.index_of(guess), self.answer_id])
+            return backend.decode_pattern(code, self.cols)
+        return backend.Judge.evaluate(guess, self.answer)
+
+    def guess(self, word):
+        self.letters = list(word.lower()[:self.cols])
+        return self.submit()
+
+
+class AdversarialGameState(GameState):
+    """Absurdle-style game where the answer is not chosen up front.
+
+    ``candidates`` holds the ids of the answers the feedback has not ruled
+    out yet (all words, or just ``answers``). Each guess splits them by
+    feedback pattern with one ``Judge.evaluate_batch`` call, or a row of the
+    ``patterns`` table, and a ``bincount``; the largest group survives, ties
+    going to the lowest pattern code. ``answer`` is one of the survivors.
+    By default there is no row limit: the game only ends once one word is
+    left and guessed.
+    """
+
+    def __init__(self, vocab, answers=None, rows=None, hard_mode=False, patterns=None):
+        if not isinstance(vocab, backend.Vocabulary):
+            vocab = backend.Vocabulary(vocab)
+        answers = None if answers is None else tuple(answers)
+        if answers is None or answers == vocab.words:
+            self.candidates = np.arange(len(vocab))
+        else:
+            ids = {vocab.index_of(w.lower()) for w in answers}
+            self.candidates = np.array(sorted(ids - {None}), dtype=np.intp)
+        if not len(self.candidates):
+            raise ValueError("No answers in the word list")
+        super().__init__(vocab[int(self.candidates[0])], vocab, rows, hard_mode, patterns)
+
+    def partition(self, guess):
+        """Pattern code of ``guess`` against every candidate."""
+        if self.patterns is not None:
+            return np.asarray(self.patterns[self.vocab.index_of(guess), self.candidates])
+        return backend.Judge.evaluate_batch(guess, self.vocab.codes[self.candidates])[0]
+
+    def judge(self, guess):
+        codes = self.partition(guess)
+        code = int(np.argmax(np.bincount(codes, minlength=3 ** self.cols)))
+        self.candidates = self.candidates[codes == code]
+        self.answer = self.vocab[int(self.candidates[0])]
+        return backend.decode_pattern(code, self.cols)
+
+
+class MultiGameState(GameState):
+    """Several answers guessed with the same words at once (Dordle, Quordle, Octordle).
+
+    Every guess is judged against all unsolved answers with one
+    ``Judge.evaluate_batch`` call, and a board stops taking guesses once it
+    is solved. Each entry of ``guesses`` holds the states per board, ``None``
+    for boards that were already solved.
+    """
+
+    def __init__(self, answers, vocab, rows=None):
+        if not isinstance(vocab, backend.Vocabulary):
+            vocab = backend.Vocabulary(vocab)
+        self.answers = [a.lower() for a in answers]
+        self.codes = backend.encode_words(self.answers)
+        self.vocab = vocab
+        self.boards = len(self.answers)
+        self.rows = self.boards + ROWS - 1 if rows is None else rows
+        self.cols = len(self.answers[0])
+        self.hard_mode = False
+        self.row = 0
+        self.letters = []
+        self.guesses = []
+        self.solved = [None] * self.boards
+        self.win = False
+        self.lose = False
+        self.constraints = [backend.Constraints(self.cols) for _ in self.answers]
+        self.feedback_masks = [vocab.letters.all] * self.boards
+
+    @property
+    def unsolved(self):
+        return [b for b, r in enumerate(self.solved) if r is None]
+
+    def remaining(self, typed=""):
+        """Words still possible, summed over the unsolved boards."""
+        total = 0
+        for b in self.unsolved:
+            mask = self.feedback_masks[b]
+            for i, ch in enumerate(typed):
+                mask &= self.vocab.letters.letter(i, ch)
+            total += mask.bit_count()
+        return total
+
+    def submit(self):
+        if self.over:
+            return SubmitResult(False, None, None)
+        if len(self.letters) < self.cols:
+            return SubmitResult(False, "Not enough letters", None)
+        guess = self.typed
+        if guess not in self.vocab:
+            return SubmitResult(False, "Not in word list", None)
+        unsolved = self.unsolved
+        codes = backend.Judge.evaluate_batch(guess, self.codes[unsolved])[0]
+        states = [None] * self.boards
+        for b, code in zip(unsolved, codes.tolist()):
+            board_states = backend.decode_pattern(code, self.cols)
+            states[b] = board_states
+            self.constraints[b].add(guess, board_states)
+            self.feedback_masks[b] = self.vocab.letters.matching(self.constraints[b])
+            if all(s == 2 for s in board_states):
+                self.solved[b] = self.row
+        self.guesses.append((guess, states))
+        self.row += 1
+        self.letters = []
+        if all(r is not None for r in self.solved):
+            self.win = True
+        elif self.row >= self.rows:
+            self.lose = True
+        return SubmitResult(True, None, states)
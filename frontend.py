@@ -1,17 +1,33 @@
 import math
+import bisect
 import random
+from collections import OrderedDict
+from concurrent.futures import Future
+import numpy as np
 import pygame
-import backend
+import engine
+import openings
+import profiler
+import solver
 
 BASE_WIDTH, BASE_HEIGHT = 550, 800
 FPS = 60
 ROWS, COLS = 6, 5
+# answers played at once; boards sit side by side and get BOARDS + 5 rows
+BOARDS = 1
+BOARD_TILE = 40
+BOARD_GAP = 32
 MARGIN_X = 32
 TOP_OFFSET = 140
 TILE_GAP = 10
 KEYBOARD_GAP = 6
 ANIM_SPEED = 0.22
 POP_SCALE = 1.08
+# animation frames pre-baked per tile look; a flip lasts ANIM_SPEED seconds
+FLIP_FRAMES = 24
+POP_FRAMES = 8
+MAX_TILE_SPRITES = 4096
+MAX_TEXT_SURFACES = 512
 
 WIDTH = BASE_WIDTH
 HEIGHT = BASE_HEIGHT
@@ -24,6 +40,7 @@ TILE_EMPTY = (248, 249, 250)
 TILE_BORDER = (200, 205, 210)
 TILE_TEXT = (20, 24, 30)
 ACCENT = (0, 120, 215)
+INVALID = (214, 72, 72)
 
 C_ABSENT = (75, 79, 92)
 C_PRESENT = (201, 180, 88)
@@ -33,6 +50,12 @@ CONFETTI_COLS = [
     (236, 99, 95), (255, 211, 102), (147, 221, 119),
     (123, 178, 255), (195, 155, 211)
 ]
+CONFETTI_COUNT = 1500
+BURST_COUNT = 24
+GRAVITY = 400
+
+# set to a profiler.FrameProfiler to time the parts of Game.draw
+PROFILER = profiler.NULL
 
 KB_ROWS = [
     list("QWERTYUIOP"),
@@ -55,9 +78,72 @@ def draw_vertical_gradient(surface, top_color, bottom_color):
         pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
 
 
+_STATIC_LAYER = None
+_TILE_SPRITES = {}
+_TILE_SIZE = {}
+_KEY_FACES = {}
+_TEXT = OrderedDict()
+
+
+def render_text(font, text, color):
+    """``font.render`` through an LRU cache; the returned surface is shared, copy it before changing it."""
+    key = (font, text, tuple(color), SCALE)
+    surf = _TEXT.get(key)
+    if surf is None:
+        surf = _TEXT[key] = font.render(text, True, color)
+        if len(_TEXT) > MAX_TEXT_SURFACES:
+            _TEXT.popitem(last=False)
+    else:
+        _TEXT.move_to_end(key)
+    return surf
+
+
+def static_layer(size):
+    """Background gradient, title and grid frame, rendered once per scale."""
+    global _STATIC_LAYER
+    key = (size, layout_key())
+    if _STATIC_LAYER is None or _STATIC_LAYER[0] != key:
+        _STATIC_LAYER = (key,) + build_static_layer(size)
+    return _STATIC_LAYER[1], _STATIC_LAYER[2]
+
+
+def build_static_layer(size):
+    layer = pygame.Surface(size)
+    draw_vertical_gradient(layer, BG_TOP, BG_BOTTOM)
+    title = render_text(TITLE_FONT, "WORDLE", TILE_TEXT)
+    title_rect = title.get_rect(center=(WIDTH // 2, 56))
+    layer.blit(title, title_rect)
+
+    size = tile_size()
+    grid_width = COLS * size + (COLS - 1) * TILE_GAP
+    grid_height = ROWS * size + (ROWS - 1) * TILE_GAP
+    outer_pad = int(12 * SCALE)
+    outer_top = TOP_OFFSET - outer_pad
+    outer_radius = max(12, int(12 * SCALE))
+    inner_inset = max(6, int(6 * SCALE))
+    for b in range(BOARDS):
+        outer_left = board_left(b) - outer_pad
+        outer_rect = pygame.Rect(outer_left, outer_top, grid_width + outer_pad * 2, grid_height + outer_pad * 2)
+        pygame.draw.rect(layer, TILE_BORDER, outer_rect, border_radius=outer_radius)
+        inner_rect = outer_rect.inflate(-inner_inset * 2, -inner_inset * 2)
+        pygame.draw.rect(layer, GRID_BG, inner_rect, border_radius=max(8, int(8 * SCALE)))
+    if pygame.display.get_surface() is not None:
+        layer = layer.convert()
+    return layer, title_rect
+
+
+def toast_area():
+    """Band between the title and the grid used by toasts and the word counter."""
+    title_rect = _STATIC_LAYER[2] if _STATIC_LAYER else pygame.Rect(0, 0, WIDTH, 80)
+    top = title_rect.bottom
+    return pygame.Rect(0, top, WIDTH, max(1, TOP_OFFSET - int(12 * SCALE) - top))
+
+
 def handle_key(game, event):
     if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
         game.submit()
+    elif event.key == pygame.K_TAB:
+        game.hint()
     elif event.key in (pygame.K_BACKSPACE, pygame.K_DELETE):
         game.backspace()
     else:
@@ -66,9 +152,55 @@ def handle_key(game, event):
             game.add_char(ch)
 
 
+def layout_key():
+    return (WIDTH, HEIGHT, SCALE, ROWS, COLS, BOARDS, MARGIN_X, TOP_OFFSET, TILE_GAP, BOARD_GAP, KEYBOARD_GAP)
+
+
+def set_boards(count):
+    """Switch the layout to ``count`` boards; call before compute_best_scale and setup_fonts."""
+    global BOARDS, ROWS
+    BOARDS = max(1, int(count))
+    ROWS = BOARDS + 5
+
+
+def set_word_length(length):
+    """Switch the layout to words of ``length`` letters (one column per letter)."""
+    global COLS
+    COLS = int(length)
+
+
+def base_width():
+    if BOARDS == 1:
+        return BASE_WIDTH
+    board_w = COLS * BOARD_TILE + (COLS - 1) * 10
+    return 64 + BOARDS * board_w + (BOARDS - 1) * BOARD_GAP
+
+
+def base_height():
+    if BOARDS == 1:
+        return BASE_HEIGHT
+    keyboard_h = len(KB_ROWS) * 34 + (len(KB_ROWS) - 1) * 6 + 20
+    return 140 + ROWS * BOARD_TILE + (ROWS - 1) * 10 + keyboard_h + 24
+
+
+def board_left(b):
+    size = tile_size()
+    board_w = COLS * size + (COLS - 1) * TILE_GAP
+    total_w = BOARDS * board_w + (BOARDS - 1) * BOARD_GAP
+    return (WIDTH - total_w) // 2 + b * (board_w + BOARD_GAP)
+
+
 def tile_size():
-    available_w = WIDTH - MARGIN_X * 2 - TILE_GAP * (COLS - 1)
-    size = max(16, available_w // COLS)
+    key = layout_key()
+    size = _TILE_SIZE.get(key)
+    if size is None:
+        size = _TILE_SIZE[key] = fit_tile_size()
+    return size
+
+
+def fit_tile_size():
+    available_w = WIDTH - MARGIN_X * 2 - BOARDS * TILE_GAP * (COLS - 1) - (BOARDS - 1) * BOARD_GAP
+    size = max(16, available_w // (COLS * BOARDS))
 
     for _ in range(6):
         key_h = max(34, int(size * 0.7))
@@ -77,7 +209,7 @@ def tile_size():
         available_h = HEIGHT - TOP_OFFSET - keyboard_reserved - int(24 * SCALE)
         size_h = max(16, (available_h - (ROWS - 1) * TILE_GAP) // ROWS)
         new_size = min(size, size_h)
-        new_size = min(new_size, max(16, available_w // COLS))
+        new_size = min(new_size, max(16, available_w // (COLS * BOARDS)))
         if new_size == size:
             break
         size = new_size
@@ -85,38 +217,60 @@ def tile_size():
     return max(16, size)
 
 
-def setup_fonts(scale: float = 1.0):
+def setup_fonts(scale: float = 1.0, size=None):
+    """Set the layout globals for ``scale`` and a window of ``size`` (defaults to the scaled base size).
+
+    Sprite caches are keyed by scale and size, so switching back and forth
+    while the window is resized reuses them instead of rebuilding; rendered
+    text is flushed whenever the scale changes.
+    """
     global TITLE_FONT, UI_FONT, TILE_FONT, KEY_FONT, SCALE, WIDTH, HEIGHT, MARGIN_X, TOP_OFFSET, TILE_GAP, KEYBOARD_GAP
+    global BOARD_GAP
+    if float(scale) != SCALE:
+        _TEXT.clear()
     SCALE = float(scale)
-    WIDTH = int(BASE_WIDTH * SCALE)
-    HEIGHT = int(BASE_HEIGHT * SCALE)
+    if size is None:
+        size = (int(base_width() * SCALE), int(base_height() * SCALE))
+    WIDTH, HEIGHT = int(size[0]), int(size[1])
     MARGIN_X = int(32 * SCALE)
     TOP_OFFSET = int(140 * SCALE)
     TILE_GAP = int(max(4, 10 * SCALE))
     KEYBOARD_GAP = int(max(4, 6 * SCALE))
+    BOARD_GAP = int(max(12, 32 * SCALE))
+
+    TITLE_FONT = get_font(max(12, int(44 * SCALE)), bold=True)
+    UI_FONT = get_font(max(10, int(18 * SCALE)))
+    TILE_FONT = get_font(max(12, int(40 * SCALE)), bold=True)
+    KEY_FONT = get_font(max(10, int(18 * SCALE)), bold=True)
+    if len(_KEY_FACES) > MAX_TILE_SPRITES:
+        _KEY_FACES.clear()
+
+
+_FONTS = {}
+
 
-    try:
-        TITLE_FONT = pygame.font.SysFont("arial", max(12, int(44 * SCALE)), bold=True)
-        UI_FONT = pygame.font.SysFont("arial", max(10, int(18 * SCALE)))
-        TILE_FONT = pygame.font.SysFont("arial", max(12, int(40 * SCALE)), bold=True)
-        KEY_FONT = pygame.font.SysFont("arial", max(10, int(18 * SCALE)), bold=True)
-    except Exception:
-        TITLE_FONT = pygame.font.SysFont(None, max(12, int(44 * SCALE)), bold=True)
-        UI_FONT = pygame.font.SysFont(None, max(10, int(18 * SCALE)))
-        TILE_FONT = pygame.font.SysFont(None, max(12, int(40 * SCALE)), bold=True)
-        KEY_FONT = pygame.font.SysFont(None, max(10, int(18 * SCALE)), bold=True)
+def get_font(size, bold=False):
+    font = _FONTS.get((size, bold))
+    if font is None:
+        try:
+            font = pygame.font.SysFont("arial", size, bold=bold)
+        except Exception:
+            font = pygame.font.SysFont(None, size, bold=bold)
+        _FONTS[(size, bold)] = font
+    return font
 
 
 def compute_total_height_for_scale(scale: float) -> int:
     s = float(scale)
-    width = int(BASE_WIDTH * s)
+    width = int(base_width() * s)
     margin_x = int(32 * s)
     top_offset = int(140 * s)
     tile_gap = int(max(4, 10 * s))
     keyboard_gap = int(max(4, 6 * s))
+    board_gap = int(max(12, 32 * s))
 
-    available_w = width - margin_x * 2 - tile_gap * (COLS - 1)
-    tile = max(16, available_w // COLS)
+    available_w = width - margin_x * 2 - BOARDS * tile_gap * (COLS - 1) - (BOARDS - 1) * board_gap
+    tile = max(16, available_w // (COLS * BOARDS))
 
     key_h = max(34, int(tile * 0.7))
     keyboard_rows = len(KB_ROWS)
@@ -131,17 +285,28 @@ def compute_total_height_for_scale(scale: float) -> int:
 
 
 def compute_best_scale(max_w: int, max_h: int) -> float:
-    max_scale_w = max_w / BASE_WIDTH
-    initial = min(1.0, max_scale_w)
-    scale = initial
-    s = scale
-    while s >= 0.5:
-        total_h = compute_total_height_for_scale(s)
-        total_w = int(BASE_WIDTH * s)
-        if total_w <= max_w and total_h <= max_h:
-            return s
-        s -= 0.01
-    return 0.5
+    # largest scale initial - 0.01 * k that fits; the layout grows with the scale,
+    # so a binary search over k finds it in a handful of height evaluations
+    initial = min(1.0, max_w / base_width())
+
+    def fits(k):
+        s = initial - 0.01 * k
+        return (int(base_width() * s) <= max_w and int(base_height() * s) <= max_h
+                and compute_total_height_for_scale(s) <= max_h)
+
+    if initial < 0.5:
+        return 0.5
+    steps = int((initial - 0.5) / 0.01 + 1e-9)
+    if not fits(steps):
+        return 0.5
+    lo, hi = 0, steps
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if fits(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return initial - 0.01 * lo
 
 
 class Tile:
@@ -149,6 +314,7 @@ class Tile:
         self.rect = pygame.Rect(rect)
         self.char = ""
         self.state = None
+        self.invalid = False
         self.flip_t = 0.0
         self.pop_t = 0.0
 
@@ -165,65 +331,117 @@ class Tile:
             self.pop_t = max(0.0, self.pop_t - dt / (ANIM_SPEED * 1.2))
 
     def draw(self, surface):
-        color = TILE_EMPTY if self.state is None else [C_ABSENT, C_PRESENT, C_CORRECT][self.state]
-        flip_phase = (1 - self.flip_t)
-        if self.state is not None:
-            face_color = color
-        else:
-            face_color = TILE_EMPTY
-
-        pop_scale = lerp(1.0, POP_SCALE, self.pop_t)
-
-        w, h = self.rect.width, self.rect.height
-        temp = pygame.Surface((w, h), pygame.SRCALPHA)
-        corner = max(8, int(8 * SCALE))
-        pygame.draw.rect(temp, face_color, (0, 0, w, h), border_radius=corner)
-        pygame.draw.rect(temp, TILE_BORDER, (0, 0, w, h), width=max(2, int(2 * SCALE)), border_radius=corner)
-
-        scale_y = abs(math.cos(flip_phase * math.pi))
-        scaled = pygame.transform.smoothscale(temp, (int(w * pop_scale), max(1, int(h * scale_y * pop_scale))))
-        cx, cy = self.rect.center
-        rect = scaled.get_rect(center=(cx, cy))
-        surface.blit(scaled, rect)
-
-        if self.char:
-            ch = self.char.upper()
-            text = TILE_FONT.render(ch, True, TILE_TEXT)
-            trect = text.get_rect(center=(cx, cy))
-            if scale_y < 0.25:
-                alpha = int(255 * max(0.0, (scale_y - 0.1) / 0.15))
-            else:
-                alpha = 255
-            text.set_alpha(alpha)
-            surface.blit(text, trect)
+        flip_q = int(round(self.flip_t * FLIP_FRAMES))
+        pop_q = int(round(self.pop_t * POP_FRAMES))
+        sprite = tile_sprite(self.rect.width, self.rect.height, self.state, self.char, self.invalid, flip_q, pop_q)
+        surface.blit(sprite, sprite.get_rect(center=self.rect.center))
+
+
+def tile_sprite(w, h, state, char, invalid, flip_q, pop_q):
+    """Cached tile image for one quantized flip/pop frame."""
+    key = (state, char, invalid, w, h, SCALE, flip_q, pop_q)
+    sprite = _TILE_SPRITES.get(key)
+    if sprite is None:
+        if len(_TILE_SPRITES) >= MAX_TILE_SPRITES:
+            _TILE_SPRITES.clear()
+        sprite = _TILE_SPRITES[key] = render_tile(w, h, state, char, invalid,
+                                                  flip_q / FLIP_FRAMES, pop_q / POP_FRAMES)
+    return sprite
+
+
+def render_tile(w, h, state, char, invalid, flip_t, pop_t):
+    face_color = TILE_EMPTY if state is None else [C_ABSENT, C_PRESENT, C_CORRECT][state]
+    flip_phase = (1 - flip_t)
+    pop_scale = lerp(1.0, POP_SCALE, pop_t)
+
+    temp = pygame.Surface((w, h), pygame.SRCALPHA)
+    corner = min(max(8, int(8 * SCALE)), w // 3)
+    pygame.draw.rect(temp, face_color, (0, 0, w, h), border_radius=corner)
+    border = INVALID if invalid else TILE_BORDER
+    pygame.draw.rect(temp, border, (0, 0, w, h), width=max(2, int(2 * SCALE)), border_radius=corner)
+
+    scale_y = abs(math.cos(flip_phase * math.pi))
+    scaled = pygame.transform.smoothscale(temp, (int(w * pop_scale), max(1, int(h * scale_y * pop_scale))))
+
+    text = None
+    if char:
+        text = render_text(tile_font(h), char.upper(), TILE_TEXT)
+        if scale_y < 0.25:
+            text = text.copy()
+            text.set_alpha(int(255 * max(0.0, (scale_y - 0.1) / 0.15)))
+
+    sw = max(scaled.get_width(), text.get_width() if text else 0)
+    sh = max(scaled.get_height(), text.get_height() if text else 0)
+    sprite = pygame.Surface((sw, sh), pygame.SRCALPHA)
+    center = (sw // 2, sh // 2)
+    sprite.blit(scaled, scaled.get_rect(center=center))
+    if text:
+        sprite.blit(text, text.get_rect(center=center))
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+    return sprite
+
+
+def tile_font(h):
+    """TILE_FONT, or a smaller one when the tiles are too small for it (many boards)."""
+    if h * 0.75 >= max(12, int(40 * SCALE)):
+        return TILE_FONT
+    return get_font(max(8, int(h * 0.6)), bold=True)
 
 
 class Keyboard:
-    def __init__(self):
+    """On-screen keys; ``key_states`` maps a letter to its best state on each board."""
+
+    def __init__(self, boards=1):
+        self.boards = boards
         self.key_states = {}
+        self._layout_key = None
+        self._layout = []
+        self._rows = []
 
-    def update_states(self, guess, eval_states):
+    def update_states(self, guess, eval_states, board=0):
         for ch, s in zip(guess.upper(), eval_states):
-            if ch not in self.key_states:
-                self.key_states[ch] = s
-            else:
-                self.key_states[ch] = max(self.key_states[ch], s)
+            states = self.key_states.get(ch, (None,) * self.boards)
+            if states[board] is None or s > states[board]:
+                self.key_states[ch] = states[:board] + (s,) + states[board + 1:]
 
     def key_at(self, pos):
-        layout = self.layout_rects()
-        for label, rect in layout:
-            if rect.collidepoint(pos):
-                return label
+        self.layout_rects()
+        x, y = pos
+        # rows are horizontal bands and keys are sorted left to right inside a row
+        r = bisect.bisect_right([top for top, _, _ in self._rows], y) - 1
+        if r < 0:
+            return None
+        _, lefts, keys = self._rows[r]
+        i = bisect.bisect_right(lefts, x) - 1
+        if i >= 0 and keys[i][1].collidepoint(pos):
+            return keys[i][0]
         return None
 
     def layout_rects(self):
+        key = layout_key()
+        if key != self._layout_key:
+            self._layout = self.compute_layout()
+            self._rows = []
+            for r in range(len(KB_ROWS)):
+                keys = self._layout[sum(len(row) for row in KB_ROWS[:r]):][:len(KB_ROWS[r])]
+                self._rows.append((keys[0][1].top, [rect.left for _, rect in keys], keys))
+            self._layout_key = key
+        return self._layout
+
+    def bounds(self):
+        layout = self.layout_rects()
+        rect = layout[0][1].unionall([r for _, r in layout[1:]])
+        return rect.inflate(2, 4)
+
+    def compute_layout(self):
         rows = []
-        grid_h = ROWS * tile_size() + (ROWS - 1) * TILE_GAP
+        size = tile_size()
+        grid_h = ROWS * size + (ROWS - 1) * TILE_GAP
         desired_kb_top = TOP_OFFSET + grid_h + int(20 * SCALE)
-        kb_width = WIDTH - MARGIN_X * 2
-        key_h = max(28, int(tile_size() * 0.72))
-        small_key_w = max(36, int(tile_size() * 0.95))
-        large_key_w = max(56, int(tile_size() * 1.25))
+        key_h = max(28, int(size * 0.72))
+        small_key_w = max(36, int(size * 0.95))
+        large_key_w = max(56, int(size * 1.25))
         bottom_margin = int(20 * SCALE)
         keyboard_rows = len(KB_ROWS)
         keyboard_reserved = keyboard_rows * key_h + (keyboard_rows - 1) * KEYBOARD_GAP + bottom_margin
@@ -234,7 +452,6 @@ class Keyboard:
             kb_top = desired_kb_top
         x = MARGIN_X
         y = kb_top
-        layout = []
         for r, row in enumerate(KB_ROWS):
             total_w = 0
             rects = []
@@ -260,183 +477,504 @@ class Keyboard:
         return rows
 
     def draw(self, surface):
-        kb_rows = self.layout_rects()
-        if not kb_rows:
-            return
-        for label, rect in kb_rows:
-            rrad = max(6, int(6 * SCALE))
-            state = None
+        unknown = (None,) * self.boards
+        for label, rect in self.layout_rects():
+            states = unknown
             if label not in ("ENTER", "DEL"):
-                state = self.key_states.get(label, None)
-            if state is None:
-                base = (240, 241, 243)
-                txt_color = TILE_TEXT
-                border_col = (200, 205, 210)
-            else:
-                base = [C_ABSENT, C_PRESENT, C_CORRECT][state]
-                txt_color = (255, 255, 255)
-                border_col = None
+                states = self.key_states.get(label, unknown)
+            surface.blit(key_face(label, states, rect.width, rect.height), rect.topleft)
+
+
+def key_face(label, states, w, h):
+    """Cached key image (shadow, body, border and label) for one tuple of per-board states."""
+    key = (label, states, w, h, SCALE)
+    face = _KEY_FACES.get(key)
+    if face is None:
+        face = _KEY_FACES[key] = render_key(label, states, w, h)
+    return face
+
+
+def render_key(label, states, w, h):
+    rrad = max(6, int(6 * SCALE))
+    neutral = (240, 241, 243)
+    known = [s for s in states if s is not None]
+    if not known:
+        base = neutral
+        txt_color = TILE_TEXT
+        border_col = (200, 205, 210)
+    else:
+        base = [C_ABSENT, C_PRESENT, C_CORRECT][known[0]]
+        txt_color = (255, 255, 255) if len(known) * 2 >= len(states) else TILE_TEXT
+        border_col = None
+
+    face = pygame.Surface((w + 1, h + 2), pygame.SRCALPHA)
+    rect = pygame.Rect(0, 0, w, h)
+    pygame.draw.rect(face, (0, 0, 0, 28), rect.move(1, 2), border_radius=rrad)
+    pygame.draw.rect(face, base, rect, border_radius=rrad)
+    if len(states) > 1 and known:
+        # one cell per board, in two rows once there are more than two boards
+        body = pygame.Surface((w, h), pygame.SRCALPHA)
+        rows = 1 if len(states) <= 2 else 2
+        cols = -(-len(states) // rows)
+        for b, s in enumerate(states):
+            r, c = divmod(b, cols)
+            x0, x1 = w * c // cols, w * (c + 1) // cols
+            y0, y1 = h * r // rows, h * (r + 1) // rows
+            body.fill(neutral if s is None else [C_ABSENT, C_PRESENT, C_CORRECT][s], (x0, y0, x1 - x0, y1 - y0))
+        mask = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(mask, (255, 255, 255, 255), rect, border_radius=rrad)
+        body.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        face.blit(body, (0, 0))
+    if border_col:
+        pygame.draw.rect(face, border_col, rect, width=max(1, int(2 * SCALE)), border_radius=rrad)
+
+    txt = render_text(KEY_FONT, label, txt_color)
+    face.blit(txt, txt.get_rect(center=rect.center))
+    if pygame.display.get_surface() is not None:
+        face = face.convert_alpha()
+    return face
+
+
+class Particles:
+    """Confetti pool stored as parallel NumPy arrays.
+
+    Slots ``[0, count)`` are alive; culling compacts the survivors to the
+    front, so spawning just fills the free tail and grows it when full.
+    """
+
+    def __init__(self, capacity=2048, seed=None):
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.sprite = np.zeros(capacity, dtype=np.intp)
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, needed):
+        capacity = len(self.life)
+        while capacity < needed:
+            capacity *= 2
+        for name in ("pos", "vel", "life", "sprite"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, n, x, y, angle=(-math.pi, 0.0), speed=(120, 300), life=(1.2, 2.0), size=(3, 6)):
+        if self.count + n > len(self.life):
+            self._grow(self.count + n)
+        rng = self.rng
+        sl = slice(self.count, self.count + n)
+        theta = rng.uniform(angle[0], angle[1], n)
+        v = rng.uniform(speed[0], speed[1], n)
+        self.pos[sl] = (x, y)
+        self.vel[sl, 0] = np.cos(theta) * v
+        self.vel[sl, 1] = np.sin(theta) * v
+        self.life[sl] = rng.uniform(life[0], life[1], n)
+        sizes = rng.integers(size[0], size[1] + 1, n)
+        colors = rng.integers(0, len(CONFETTI_COLS), n)
+        self.sprite[sl] = colors * _MAX_CONFETTI_SIZE + sizes
+        self.count += n
+
+    def update(self, dt, bottom):
+        n = self.count
+        if not n:
+            return
+        vel = self.vel[:n]
+        vel[:, 1] += GRAVITY * dt
+        self.pos[:n] += vel * dt
+        self.life[:n] -= dt
+        alive = (self.life[:n] > 0) & (self.pos[:n, 1] < bottom)
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            k = len(keep)
+            for arr in (self.pos, self.vel, self.life, self.sprite):
+                arr[:k] = arr[keep]
+            self.count = k
 
-            shadow = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(shadow, (0, 0, 0, 28), shadow.get_rect(), border_radius=rrad)
-            surface.blit(shadow, (rect.x + 1, rect.y + 2))
+    def draw(self, surface):
+        n = self.count
+        if not n:
+            return
+        sprites = confetti_sprites()[self.sprite[:n]].tolist()
+        surface.blits(zip(sprites, self.pos[:n].astype(np.int32).tolist()), doreturn=False)
 
-            pygame.draw.rect(surface, base, rect, border_radius=rrad)
-            if border_col:
-                pygame.draw.rect(surface, border_col, rect, width=max(1, int(2 * SCALE)), border_radius=rrad)
 
-            txt = KEY_FONT.render(label, True, txt_color)
-            surface.blit(txt, txt.get_rect(center=rect.center))
+_MAX_CONFETTI_SIZE = 16
+_CONFETTI_SPRITES = None
+
+
+def confetti_sprites():
+    """Solid squares indexed by ``color * _MAX_CONFETTI_SIZE + size``."""
+    global _CONFETTI_SPRITES
+    if _CONFETTI_SPRITES is None:
+        table = np.empty(len(CONFETTI_COLS) * _MAX_CONFETTI_SIZE, dtype=object)
+        for c, color in enumerate(CONFETTI_COLS):
+            for size in range(_MAX_CONFETTI_SIZE):
+                square = pygame.Surface((max(1, size), max(1, size)))
+                square.fill(color)
+                table[c * _MAX_CONFETTI_SIZE + size] = square
+        _CONFETTI_SPRITES = table
+    return _CONFETTI_SPRITES
+
+
+class PendingState(engine.GameState):
+    """Stands in for the rules while the word list loads: letters can be typed, nothing is judged."""
+
+    def __init__(self, rows, cols, hard_mode=False):
+        self.rows = rows
+        self.cols = cols
+        self.hard_mode = hard_mode
+        self.row = 0
+        self.letters = []
+        self.guesses = []
+        self.win = False
+        self.lose = False
 
 
 class Game:
-    def __init__(self, answer, vocab, screen):
-        self.answer = answer
-        self.vocab = set(vocab)
+    """The pygame view of one game; ``answer`` may be a list of words to play several boards at once.
+
+    ``vocab`` may be a Future from ``backend.load_vocabulary_async`` and
+    ``answer`` a function picking the answers from the loaded vocabulary;
+    the game then draws and takes keystrokes right away and only waits for
+    the word list on the first submit or hint.
+
+    With ``adversarial`` set, ``answer`` is the pool of possible answers
+    instead and the rules are ``engine.AdversarialGameState`` on one board.
+    """
+
+    def __init__(self, answer, vocab, screen, hard_mode=False, seed=None, adversarial=False):
+        if adversarial:
+            boards = 1
+        else:
+            boards = BOARDS if callable(answer) else (1 if isinstance(answer, str) else len(answer))
+        self.adversarial = adversarial
+        self.answers = []
+        self.state = PendingState(ROWS, COLS, hard_mode)
+        self._pending = (answer, vocab)
+        self.remaining = 0
         self.screen = screen
-        self.grid = []
-        size = tile_size()
-        grid_width = COLS * size + (COLS - 1) * TILE_GAP
-        grid_left = (WIDTH - grid_width) // 2
-        self.grid_left = grid_left
-        for r in range(ROWS):
-            row = []
-            for c in range(COLS):
-                x = grid_left + c * (size + TILE_GAP)
-                y = TOP_OFFSET + r * (size + TILE_GAP)
-                row.append(Tile((x, y, size, size)))
-            self.grid.append(row)
-        self.particles = []
-        self.row = 0
-        self.col = 0
-        self.keyboard = Keyboard()
+        self.boards = [[[Tile((0, 0, 0, 0)) for _ in range(COLS)] for _ in range(self.state.rows)]
+                       for _ in range(boards)]
+        self.relayout()
+        self.rng = random.Random(seed)
+        self.particles = Particles(seed=seed)
+        self.keyboard = Keyboard(boards)
+        # set by the caller to a stats.Stats to show in the end-of-game modal
+        self.stats = None
         self.message = ""
         self.msg_timer = 0.0
-        self.win = False
-        self.lose = False
         self.shake_t = 0.0
+        self.dirty = []
+        self.dirty_all = True
+        if not isinstance(vocab, Future) or vocab.done():
+            self.resolve()
+
+    @property
+    def loading(self):
+        return self._pending is not None
+
+    def resolve(self):
+        """Pick the answers and switch to the real rules, waiting for the word list if needed."""
+        if self._pending is None:
+            return
+        answer, vocab = self._pending
+        self._pending = None
+        if isinstance(vocab, Future):
+            vocab = vocab.result()
+        if callable(answer):
+            answer = answer(vocab)
+        answers = [answer] if isinstance(answer, str) else list(answer)
+        typed = self.state.letters
+        if self.adversarial:
+            self.state = engine.AdversarialGameState(vocab, answers, rows=ROWS, hard_mode=self.state.hard_mode)
+            answers = [self.state.answer]
+        elif len(answers) == 1:
+            self.state = engine.GameState(answers[0], vocab, rows=ROWS, hard_mode=self.state.hard_mode)
+        else:
+            self.state = engine.MultiGameState(answers, vocab, rows=ROWS)
+        self.answers = [a.lower() for a in answers]
+        self.vocab = self.state.vocab
+        self.solver = solver.Solver(self.vocab)
+        # looked up on the first hint; False once known to be missing for this game
+        self.book = None
+        self.remaining = len(self.vocab) * len(answers)
+        self.state.letters = typed
+        if typed:
+            self.check_prefix()
+
+    def relayout(self, screen=None):
+        """Move the tiles to the current layout; call after setup_fonts on resize."""
+        if screen is not None:
+            self.screen = screen
+        size = tile_size()
+        for b, grid in enumerate(self.boards):
+            left = board_left(b)
+            for r, row in enumerate(grid):
+                for c, tile in enumerate(row):
+                    x = left + c * (size + TILE_GAP)
+                    y = TOP_OFFSET + r * (size + TILE_GAP)
+                    tile.rect = pygame.Rect(x, y, size, size)
+        self.mark_dirty()
+
+    @property
+    def answer(self):
+        return " ".join(self.answers)
+
+    @property
+    def hard_mode(self):
+        return self.state.hard_mode
+
+    @property
+    def row(self):
+        return self.state.row
+
+    @property
+    def col(self):
+        return self.state.col
+
+    @property
+    def win(self):
+        return self.state.win
+
+    @property
+    def lose(self):
+        return self.state.lose
+
+    def open_boards(self):
+        """Boards still taking guesses."""
+        if self.loading:
+            return list(range(len(self.boards)))
+        if len(self.boards) == 1:
+            return [] if self.win else [0]
+        return self.state.unsolved
+
+    def typing_tiles(self):
+        return [self.boards[b][self.row] for b in self.open_boards()]
 
     def add_char(self, ch):
-        if self.win or self.lose:
-            return
-        if self.col < COLS and ch.isalpha():
-            self.grid[self.row][self.col].char = ch.upper()
-            self.grid[self.row][self.col].start_pop()
-            self.col += 1
+        col = self.col
+        if self.state.add_char(ch):
+            for row in self.typing_tiles():
+                row[col].char = ch.upper()
+                row[col].start_pop()
+            self.check_prefix()
+            self.mark_dirty(self.row_area(self.row))
 
     def backspace(self):
-        if self.win or self.lose:
+        if self.state.backspace():
+            for row in self.typing_tiles():
+                row[self.col].char = ""
+            self.check_prefix()
+            self.mark_dirty(self.row_area(self.row))
+
+    def current_guess(self):
+        return self.state.typed
+
+    def check_prefix(self):
+        if self.loading:
             return
-        if self.col > 0:
-            self.col -= 1
-            self.grid[self.row][self.col].char = ""
+        # flag the row as soon as no word in the list starts with what was typed
+        invalid = not self.state.prefix_valid()
+        for row in self.typing_tiles():
+            for tile in row:
+                tile.invalid = invalid
+        self.remaining = self.state.remaining(self.state.typed)
+        self.mark_dirty(toast_area())
 
     def submit(self):
-        if self.win or self.lose:
-            return
-        if self.col < COLS:
-            self.toast("Not enough letters")
-            self.shake()
-            return
-        guess = "".join(tile.char for tile in self.grid[self.row]).lower()
-        if guess not in self.vocab:
-            self.toast("Not in word list")
-            self.shake()
+        self.resolve()
+        row = self.row
+        open_boards = self.open_boards()
+        result = self.state.submit()
+        if not result.ok:
+            if result.message:
+                self.toast(result.message)
+                self.shake()
             return
-        states = backend.Judge.evaluate(guess, self.answer)
-        for i, tile in enumerate(self.grid[self.row]):
-            tile.state = states[i]
-            tile.start_flip()
-        self.keyboard.update_states(guess, states)
-        if all(s == 2 for s in states):
-            self.win = True
-            self.toast(random.choice(["Genius!", "Magnificent!", "Splendid!", "Great!"]))
+        guess = self.state.guesses[-1][0]
+        if self.adversarial:
+            self.answers = [self.state.answer]
+        board_states = [result.states] if len(self.boards) == 1 else result.states
+        for b in open_boards:
+            states = board_states[b]
+            for i, tile in enumerate(self.boards[b][row]):
+                tile.invalid = False
+                tile.state = states[i]
+                tile.start_flip()
+            self.keyboard.update_states(guess, states, b)
+            self.spawn_bursts(b, row, states)
+        self.remaining = self.state.remaining()
+        self.mark_dirty(self.keyboard.bounds())
+        self.mark_dirty(toast_area())
+        if self.win or self.lose:
+            self.mark_dirty()
+        if self.win:
+            self.toast(self.rng.choice(["Genius!", "Magnificent!", "Splendid!", "Great!"]))
             self.spawn_confetti()
+        elif self.lose:
+            missed = [self.answers[b] for b in open_boards if board_states[b] != [2] * COLS]
+            self.toast(" ".join(missed).upper())
+
+    def feedback_masks(self):
+        if len(self.boards) == 1:
+            return [self.state.feedback_mask]
+        return [self.state.feedback_masks[b] for b in self.state.unsolved]
+
+    def hint(self):
+        self.resolve()
+        if self.win or self.lose:
+            return
+        # suggest for the board with the fewest words left
+        masks = self.feedback_masks()
+        boards = [0] if len(self.boards) == 1 else self.state.unsolved
+        i = min(range(len(masks)), key=lambda i: masks[i].bit_count())
+        self.solver.candidates = self.vocab.letters.indices(masks[i])
+        constraints = self.state.constraints if self.hard_mode else None
+        word = self.book_move(boards[i]) or self.solver.suggest(constraints)
+        if word:
+            self.toast(f"Try {word.upper()} ({self.solver.remaining} left)", duration=2.0)
+
+    def book_move(self, board):
+        """Opening book suggestion for ``board``, or None without a stored book or after row two."""
+        if self.book is None:
+            # main.py builds a missing book in another process; the next game finds it
+            self.book = openings.find_opening_book(self.vocab) or False
+        if not self.book:
+            return None
+        if len(self.boards) == 1:
+            history = self.state.guesses
         else:
-            self.row += 1
-            self.col = 0
-            if self.row >= ROWS:
-                self.lose = True
-                self.toast(self.answer.upper())
+            history = [(guess, states[board]) for guess, states in self.state.guesses]
+        return self.book.lookup(history, self.hard_mode)
 
     def toast(self, msg, duration=1.4):
         self.message = msg
         self.msg_timer = duration
+        self.mark_dirty(toast_area())
 
     def shake(self):
         self.shake_t = 1.0
 
+    def mark_dirty(self, rect=None):
+        if rect is None:
+            self.dirty_all = True
+        else:
+            self.dirty.append(pygame.Rect(rect))
+
+    def take_dirty(self):
+        """Screen regions changed since the last call, for display.update."""
+        if self.dirty_all:
+            rects = [self.screen.get_rect()]
+        else:
+            rects = self.dirty
+        self.dirty = []
+        self.dirty_all = False
+        return rects
+
+    def row_area(self, r):
+        rect = self.boards[0][r][0].rect.union(self.boards[-1][r][-1].rect)
+        # room for the pop animation and the glyph around the tile
+        return rect.inflate(rect.height // 3, rect.height // 3)
+
+    def grid_area(self):
+        first, last = self.boards[0], self.boards[-1]
+        rect = first[0][0].rect.union(last[-1][-1].rect)
+        return rect.inflate(rect.width // 10 + 24, first[0][0].rect.height // 3)
+
+    def tiles(self):
+        return (tile for grid in self.boards for row in grid for tile in row)
+
+    def is_animating(self):
+        if self.shake_t > 0 or self.particles:
+            return True
+        return any(tile.flip_t > 0 or tile.pop_t > 0 for tile in self.tiles())
+
+    def next_wakeup(self):
+        """Seconds until the game needs another frame without input, or None."""
+        if self.is_animating() or self.dirty or self.dirty_all:
+            return 0.0
+        if self.loading:
+            # poll for the word list; it usually arrives within a few frames
+            return 0.05
+        if self.msg_timer > 0:
+            return self.msg_timer
+        return None
+
     def spawn_confetti(self):
-        cx = WIDTH // 2
-        for _ in range(150):
-            angle = random.uniform(-math.pi, 0)
-            speed = random.uniform(120, 300)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.randint(3, 6)
-            color = random.choice(CONFETTI_COLS)
-            life = random.uniform(1.2, 2.0)
-            self.particles.append([cx, TOP_OFFSET - 30, vx, vy, size, color, life])
+        self.particles.spawn(CONFETTI_COUNT, WIDTH // 2, TOP_OFFSET - 30)
+
+    def spawn_bursts(self, board, row, states):
+        # a small burst over every correct tile of the row just scored
+        for tile, st in zip(self.boards[board][row], states):
+            if st == 2:
+                cx, cy = tile.rect.center
+                self.particles.spawn(BURST_COUNT, cx, cy, speed=(60, 180), life=(0.5, 0.9), size=(2, 4))
 
     def update_confetti(self, dt):
-        gravity = 400
-        new = []
-        for p in self.particles:
-            x, y, vx, vy, s, color, life = p
-            vy += gravity * dt
-            x += vx * dt
-            y += vy * dt
-            life -= dt
-            if life > 0 and y < HEIGHT + 20:
-                new.append([x, y, vx, vy, s, color, life])
-        self.particles = new
+        self.particles.update(dt, HEIGHT + 20)
 
     def update(self, dt):
-        for row in self.grid:
-            for tile in row:
-                tile.update(dt)
+        if self.loading and self._pending[1].done():
+            self.resolve()
+        for r in range(self.state.rows):
+            rows = [grid[r] for grid in self.boards]
+            if any(tile.flip_t > 0 or tile.pop_t > 0 for row in rows for tile in row):
+                self.mark_dirty(self.row_area(r))
+                for row in rows:
+                    for tile in row:
+                        tile.update(dt)
         if self.msg_timer > 0:
             self.msg_timer -= dt
             if self.msg_timer <= 0:
                 self.message = ""
+                self.mark_dirty(toast_area())
         if self.shake_t > 0:
             self.shake_t = max(0.0, self.shake_t - dt / 0.4)
-        self.update_confetti(dt)
+            self.mark_dirty(self.grid_area())
+        if self.particles:
+            self.update_confetti(dt)
+            # confetti flies over the whole window, including its last frame
+            self.mark_dirty()
 
     def draw(self, surface):
-        draw_vertical_gradient(surface, BG_TOP, BG_BOTTOM)
-        title = TITLE_FONT.render("WORDLE", True, TILE_TEXT)
-        title_rect = title.get_rect(center=(WIDTH // 2, 56))
-        surface.blit(title, title_rect)
-
-        size = tile_size()
-        grid_width = COLS * size + (COLS - 1) * TILE_GAP
-        grid_height = ROWS * size + (ROWS - 1) * TILE_GAP
-        outer_pad = int(12 * SCALE)
-        outer_left = self.grid_left - outer_pad
-        outer_top = TOP_OFFSET - outer_pad
-        outer_rect = pygame.Rect(outer_left, outer_top, grid_width + outer_pad * 2, grid_height + outer_pad * 2)
-        outer_radius = max(12, int(12 * SCALE))
-
-        pygame.draw.rect(surface, TILE_BORDER, outer_rect, border_radius=outer_radius)
-
-        inner_inset = max(6, int(6 * SCALE))
-        inner_rect = outer_rect.inflate(-inner_inset * 2, -inner_inset * 2)
-        pygame.draw.rect(surface, GRID_BG, inner_rect, border_radius=max(8, int(8 * SCALE)))
+        with PROFILER.section("background"):
+            layer, title_rect = static_layer(surface.get_size())
+            surface.blit(layer, (0, 0))
+        with PROFILER.section("tiles"):
+            self.draw_tiles(surface)
+        with PROFILER.section("toast"):
+            self.draw_toast(surface, title_rect)
+        with PROFILER.section("keyboard"):
+            self.keyboard.draw(surface)
+        with PROFILER.section("confetti"):
+            self.draw_confetti(surface)
+        if self.win or self.lose:
+            with PROFILER.section("modal"):
+                self.draw_modal(surface)
 
+    def draw_tiles(self, surface):
         dx = 0
         if self.shake_t > 0:
             dx = math.sin((1 - self.shake_t) * 30) * 8 * self.shake_t
-        for r in range(ROWS):
-            for c in range(COLS):
-                tile = self.grid[r][c]
-                saved = tile.rect.copy()
-                tile.rect.x = saved.x + int(dx)
-                tile.draw(surface)
-                tile.rect = saved
+        for tile in self.tiles():
+            saved = tile.rect.copy()
+            tile.rect.x = saved.x + int(dx)
+            tile.draw(surface)
+            tile.rect = saved
+
+    def draw_toast(self, surface, title_rect):
+        if not self.message and self.row > 0 and not (self.win or self.lose):
+            label = "1 word remains" if self.remaining == 1 else f"{self.remaining} words remain"
+            count = render_text(UI_FONT, label, C_ABSENT)
+            surface.blit(count, count.get_rect(center=(WIDTH // 2, title_rect.bottom + (TOP_OFFSET - title_rect.bottom) // 2)))
 
         if self.message:
-            toast_surf = UI_FONT.render(self.message, True, TILE_TEXT)
+            toast_surf = render_text(UI_FONT, self.message, TILE_TEXT)
             pad = max(8, int(12 * SCALE))
             # place toast vertically between title bottom and grid top so it doesn't overlap the title
             grid_top = TOP_OFFSET
@@ -447,50 +985,82 @@ class Game:
             surface.blit(bg, bg.get_rect(center=rect.center))
             surface.blit(toast_surf, rect)
 
-        self.keyboard.draw(surface)
+    def draw_confetti(self, surface):
+        self.particles.draw(surface)
 
-        for x, y, vx, vy, s, color, life in self.particles:
-            pygame.draw.rect(surface, color, pygame.Rect(int(x), int(y), s, s))
+    def draw_modal(self, surface):
+        sw, sh = surface.get_size()
+        overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        surface.blit(overlay, (0, 0))
 
-        if self.win or self.lose:
-            sw, sh = surface.get_size()
-            overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            surface.blit(overlay, (0, 0))
-
-            modal_w = 420
-            modal_h = 200
-            mx = (sw - modal_w) // 2
-            my = (sh - modal_h) // 2
-            modal = pygame.Rect(mx, my, modal_w, modal_h)
-            pygame.draw.rect(surface, (255, 255, 255), modal, border_radius=12)
-            pygame.draw.rect(surface, TILE_BORDER, modal, width=2, border_radius=12)
-
-            if self.win:
-                title = "Congratulations!"
-                sub = f"You guessed {self.answer.upper()}"
-                color = C_CORRECT
-            else:
-                title = "Game Over"
-                sub = f"Answer: {self.answer.upper()}"
-                color = (180, 40, 40)
-
-            title_s = UI_FONT.render(title, True, color)
-            surface.blit(title_s, (modal.centerx - title_s.get_width()//2, my + 20))
-            sub_s = UI_FONT.render(sub, True, TILE_TEXT)
-            surface.blit(sub_s, (modal.centerx - sub_s.get_width()//2, my + 60))
-
-            btn_w = 140
-            btn_h = 44
-            pad = 24
-            restart = pygame.Rect(modal.left + pad, modal.bottom - pad - btn_h, btn_w, btn_h)
-            quitb = pygame.Rect(modal.right - pad - btn_w, modal.bottom - pad - btn_h, btn_w, btn_h)
-            pygame.draw.rect(surface, C_CORRECT if self.win else ACCENT, restart, border_radius=8)
-            pygame.draw.rect(surface, TILE_BORDER, quitb, border_radius=8)
-            rtxt = KEY_FONT.render("PLAY AGAIN", True, (255, 255, 255))
-            qtxt = KEY_FONT.render("QUIT", True, TILE_TEXT)
-            surface.blit(rtxt, (restart.centerx - rtxt.get_width()//2, restart.centery - rtxt.get_height()//2))
-            surface.blit(qtxt, (quitb.centerx - qtxt.get_width()//2, quitb.centery - qtxt.get_height()//2))
-
-            self.restart_rect = restart
-            self.quit_rect = quitb
+        if self.win:
+            title = "Congratulations!"
+            sub = f"You guessed {self.answer.upper()}"
+            color = C_CORRECT
+        else:
+            title = "Game Over"
+            sub = f"Answer{'s' if len(self.answers) > 1 else ''}: {self.answer.upper()}"
+            color = (180, 40, 40)
+        title_s = render_text(UI_FONT, title, color)
+        sub_s = render_text(UI_FONT, sub, TILE_TEXT)
+
+        modal_w = max(420, sub_s.get_width() + 48)
+        modal_h = 200
+        line_h = UI_FONT.get_linesize()
+        if self.stats is not None:
+            # summary line, one bar per guess count and the best letters
+            modal_h += line_h + len(self.stats.histogram) * (line_h + 2) + 12
+            if self.stats.best_letters():
+                modal_h += line_h
+        mx = (sw - modal_w) // 2
+        my = (sh - modal_h) // 2
+        modal = pygame.Rect(mx, my, modal_w, modal_h)
+        pygame.draw.rect(surface, (255, 255, 255), modal, border_radius=12)
+        pygame.draw.rect(surface, TILE_BORDER, modal, width=2, border_radius=12)
+
+        surface.blit(title_s, (modal.centerx - title_s.get_width()//2, my + 20))
+        surface.blit(sub_s, (modal.centerx - sub_s.get_width()//2, my + 60))
+        if self.stats is not None:
+            self.draw_stats(surface, pygame.Rect(mx + 24, my + 60 + line_h + 12, modal_w - 48, modal_h))
+
+        btn_w = 140
+        btn_h = 44
+        pad = 24
+        restart = pygame.Rect(modal.left + pad, modal.bottom - pad - btn_h, btn_w, btn_h)
+        quitb = pygame.Rect(modal.right - pad - btn_w, modal.bottom - pad - btn_h, btn_w, btn_h)
+        pygame.draw.rect(surface, C_CORRECT if self.win else ACCENT, restart, border_radius=8)
+        pygame.draw.rect(surface, TILE_BORDER, quitb, border_radius=8)
+        rtxt = render_text(KEY_FONT, "PLAY AGAIN", (255, 255, 255))
+        qtxt = render_text(KEY_FONT, "QUIT", TILE_TEXT)
+        surface.blit(rtxt, (restart.centerx - rtxt.get_width()//2, restart.centery - rtxt.get_height()//2))
+        surface.blit(qtxt, (quitb.centerx - qtxt.get_width()//2, quitb.centery - qtxt.get_height()//2))
+
+        self.restart_rect = restart
+        self.quit_rect = quitb
+
+    def draw_stats(self, surface, area):
+        st = self.stats
+        line_h = UI_FONT.get_linesize()
+        summary = (f"Played {st.games}   Win {st.win_rate:.0%}   "
+                   f"Streak {st.streak}   Max {st.max_streak}")
+        text = render_text(UI_FONT, summary, TILE_TEXT)
+        surface.blit(text, (area.centerx - text.get_width() // 2, area.top))
+        y = area.top + line_h + 6
+        turns = len(self.state.guesses) if self.win else 0
+        label_w = render_text(UI_FONT, "X", TILE_TEXT).get_width() + 8
+        most = max(1, max(st.histogram))
+        # rows 1..n, then losses as X
+        for n in list(range(1, len(st.histogram))) + [0]:
+            label = render_text(UI_FONT, str(n) if n else "X", TILE_TEXT)
+            surface.blit(label, (area.left, y))
+            count = render_text(UI_FONT, str(st.histogram[n]), (255, 255, 255))
+            w = max(count.get_width() + 8, int((area.width - label_w) * st.histogram[n] / most))
+            bar = pygame.Rect(area.left + label_w, y, w, line_h)
+            pygame.draw.rect(surface, C_CORRECT if n == turns else C_ABSENT, bar, border_radius=3)
+            surface.blit(count, (bar.right - count.get_width() - 4, y))
+            y += line_h + 2
+        best = st.best_letters()
+        if best:
+            text = render_text(UI_FONT, "Best letters: " + " ".join(best).upper(), C_ABSENT)
+            surface.blit(text, (area.centerx - text.get_width() // 2, y + 4))
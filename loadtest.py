@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+
+import backend
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection to the game server."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                          f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                          .encode('latin-1') + body)
+        status_line = await self.reader.readline()
+        status = int(status_line.split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value.strip())
+        data = await self.reader.readexactly(length)
+        return status, json.loads(data)
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100.0 * len(sorted_values)))]
+
+
+async def worker(client, sessions, words, rng, guesses_per_session, latencies, counter):
+    await client.connect()
+    try:
+        while counter[0] < sessions:
+            counter[0] += 1
+            status, data = await client.request("POST", "/session", {})
+            if status != 201:
+                raise RuntimeError(f"create failed: {status} {data}")
+            sid = data["id"]
+            for _ in range(guesses_per_session):
+                start = time.perf_counter()
+                status, data = await client.request("POST", f"/session/{sid}/guess", {"guess": rng.choice(words)})
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    raise RuntimeError(f"guess failed: {status} {data}")
+                if data["done"]:
+                    break
+    finally:
+        client.close()
+
+
+async def run(args):
+    words = list(backend.get_vocab())
+    latencies = []
+    counter = [0]
+    clients = [Client(args.host, args.port) for _ in range(args.connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(c, args.sessions, words, random.Random(args.seed + i), args.guesses,
+                                  latencies, counter)
+                           for i, c in enumerate(clients)))
+    elapsed = time.perf_counter() - start
+    stats_client = Client(args.host, args.port)
+    await stats_client.connect()
+    _, stats = await stats_client.request("GET", "/stats")
+    stats_client.close()
+
+    latencies.sort()
+    ms = [v * 1000.0 for v in latencies]
+    print(f"sessions created:  {counter[0]} ({stats['sessions']} held by server)")
+    if stats["max_rss_kb"] is not None:
+        print(f"server max RSS:    {stats['max_rss_kb'] / 1024:.1f} MiB")
+    print(f"guess requests:    {len(ms)} in {elapsed:.2f}s ({len(ms) / max(elapsed, 1e-9):.0f}/s)")
+    print(f"guess latency ms:  p50 {percentile(ms, 50):.2f}  p95 {percentile(ms, 95):.2f}  "
+          f"p99 {percentile(ms, 99):.2f}  max {ms[-1] if ms else 0:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test for server.py on localhost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--guesses", type=int, default=6, help="guesses per session (stops early on a finished game)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start-server", action="store_true", help="launch server.py as a subprocess first")
+    args = parser.parse_args(argv)
+
+    proc = None
+    if args.start_server:
+        server = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+        proc = subprocess.Popen([sys.executable, server, "--host", args.host, "--port", str(args.port)],
+                                stdout=subprocess.PIPE, text=True)
+        proc.stdout.readline()
+    try:
+        asyncio.run(run(args))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,229 @@
+import os
+import time
+import random
+import argparse
 import pygame
 import backend
 import frontend
+import openings
+import profiler
+import recorder
+import stats
 
-def main():
+STARTED = time.perf_counter()
+# an unknown WORDLE_PACK is reported by parse_args; meanwhile load the default list
+ENV_PACK = os.environ.get("WORDLE_PACK")
+if ENV_PACK not in backend.list_packs():
+    ENV_PACK = None
+# the word list loads while pygame starts up and the first frame is drawn
+VOCAB = backend.load_vocabulary_async(ENV_PACK)
+VOCAB_READY = []
+VOCAB.add_done_callback(lambda _: VOCAB_READY.append(time.perf_counter()))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Wordle")
+    parser.add_argument("--hard", action="store_true", default=os.environ.get("WORDLE_HARD") == "1",
+                        help="revealed hints must be used in every guess (or set WORDLE_HARD=1)")
+    parser.add_argument("--adversarial", action="store_true", default=os.environ.get("WORDLE_ADVERSARIAL") == "1",
+                        help="the answer dodges your guesses, Absurdle style, within the board's "
+                             f"{frontend.ROWS} rows (or set WORDLE_ADVERSARIAL=1)")
+    parser.add_argument("--continuous", action="store_true",
+                        help="redraw every frame instead of sleeping while nothing changes")
+    parser.add_argument("--profile", action="store_true", default=bool(os.environ.get("WORDLE_PROFILE")),
+                        help="time each frame; F3 toggles the overlay (or set WORDLE_PROFILE=1)")
+    parser.add_argument("--profile-out", metavar="PATH", default=os.environ.get("WORDLE_PROFILE_OUT"),
+                        help="write per-frame timings as CSV on exit (implies --profile)")
+    parser.add_argument("--boards", type=int, choices=(1, 2, 4, 8), default=os.environ.get("WORDLE_BOARDS", "1"),
+                        help="answers to solve at once with the same guesses (or set WORDLE_BOARDS)")
+    parser.add_argument("--pack", default=os.environ.get("WORDLE_PACK"),
+                        help=f"word pack to play (default {backend.DEFAULT_PACK}, or set WORDLE_PACK)")
+    parser.add_argument("--list-packs", action="store_true", help="list the installed word packs and exit")
+    parser.add_argument("--no-stats", action="store_true",
+                        help="do not record results in $WORDLE_HOME (default ~/.wordle)")
+    parser.add_argument("--seed", type=int, help="seed for answers and effects (random by default)")
+    parser.add_argument("--record", metavar="PATH", default=os.environ.get("WORDLE_RECORD"),
+                        help="log every input event for replay.py (or set WORDLE_RECORD)")
+    args = parser.parse_args(argv)
+    # argparse converts a string default but does not check it against choices
+    if args.boards not in (1, 2, 4, 8):
+        parser.error(f"WORDLE_BOARDS must be 1, 2, 4 or 8, not {args.boards}")
+    packs = backend.list_packs()
+    if args.pack and args.pack not in packs:
+        parser.error(f"unknown word pack {args.pack!r} (choose from {', '.join(packs)})")
+    if args.hard and args.boards > 1:
+        parser.error("hard mode needs a single board")
+    if args.adversarial and args.boards > 1:
+        parser.error("adversarial mode needs a single board")
+    return args
+
+
+class App:
+    """Event handling and per-frame work of the window, shared with ``replay.py``."""
+
+    def __init__(self, screen, vocab, hard_mode=False, seed=None, continuous=False,
+                 prof=profiler.NULL, overlay_font=None, recorder=None, boards=1, pack=None, stats=None,
+                 adversarial=False):
+        self.screen = screen
+        self.adversarial = adversarial
+        self.stats = stats
+        self.pack = backend.get_pack(pack)
+        self.hard_mode = hard_mode
+        self.boards = boards
+        self.seed = random.randrange(2 ** 31) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.continuous = continuous
+        self.prof = prof
+        self.overlay_font = overlay_font
+        self.recorder = recorder
+        self.running = True
+        self.game = None
+        self.new_game(vocab)
+
+    def new_game(self, vocab=None):
+        if vocab is None:
+            vocab = self.pack.vocabulary(reload=True)
+        seed = self.rng.randrange(2 ** 31)
+        self.game = frontend.Game(self.pick_targets, vocab, self.screen, hard_mode=self.hard_mode, seed=seed,
+                                  adversarial=self.adversarial)
+
+    def pick_targets(self, vocab):
+        if self.adversarial:
+            # no answer yet: every answer word stays possible until the feedback rules it out
+            self.record_game(vocab, "")
+            return self.pack.answer_words()
+        targets = []
+        while len(targets) < self.boards:
+            word = backend.pick_daily_word(self.pack.answer_words(), self.rng)
+            if word not in targets:
+                targets.append(word)
+        target = " ".join(targets)
+        try:
+            print(f"Word: {target}")
+        except Exception:
+            pass
+        self.record_game(vocab, target)
+        return targets
+
+    def record_game(self, vocab, target):
+        if not self.recorder:
+            return
+        if "vocab" not in self.recorder.header:
+            # known only now that the background load is done; the header line could not wait for it
+            self.recorder.add_header(vocab=backend.vocab_hash(vocab.words))
+        self.recorder.game(target)
+
+    def frame(self, events, dt):
+        prof = self.prof
+        game = self.game
+        prof.begin_frame()
+        resize_to = None
+        with prof.section("events"):
+            for event in events:
+                if self.recorder:
+                    self.recorder.event(event)
+                if event.type == pygame.QUIT:
+                    self.running = False
+                elif event.type == pygame.VIDEORESIZE:
+                    # a drag sends a burst of these; only the last size matters
+                    resize_to = event.size
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    game.mark_dirty()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    prof.toggle()
+                    game.mark_dirty()
+                elif event.type == pygame.KEYDOWN:
+                    if getattr(game, 'win', False) or getattr(game, 'lose', False):
+                        if event.key == pygame.K_SPACE:
+                            self.new_game()
+                            game = self.game
+                            continue
+                        elif event.key == pygame.K_ESCAPE:
+                            self.running = False
+                            continue
+                        else:
+                            continue
+                    frontend.handle_key(game, event)
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if getattr(game, 'win', False) or getattr(game, 'lose', False):
+                        if getattr(game, 'restart_rect', None) and game.restart_rect.collidepoint(event.pos):
+                            self.new_game()
+                            game = self.game
+                            continue
+                        if getattr(game, 'quit_rect', None) and game.quit_rect.collidepoint(event.pos):
+                            self.running = False
+                            break
+
+                    label = game.keyboard.key_at(event.pos)
+                    if label:
+                        print(f"Clicked label: {label}")
+                        if label in ("ENTER", "Enter"):
+                            game.submit()
+                        elif label in ("⌫", "Delete", "Del", "DEL"):
+                            game.backspace()
+                        else:
+                            ch = label
+                            if isinstance(ch, str) and len(ch) == 1:
+                                game.add_char(ch)
+
+        game = self.game
+        if (self.stats is not None and game.stats is None and game.state.over
+                and len(game.answers) == 1 and not game.adversarial):
+            guesses = [guess for guess, _ in game.state.guesses]
+            try:
+                game.stats = self.stats.record(game.answers[0], guesses, game.win, game.hard_mode)
+            except OSError as exc:
+                print(f"Stats disabled: {exc}")
+                self.stats = None
+                game.toast("Could not save stats", duration=2.0)
+            game.mark_dirty()
+
+        if resize_to is not None:
+            with prof.section("resize"):
+                w, h = max(200, resize_to[0]), max(300, resize_to[1])
+                frontend.setup_fonts(frontend.compute_best_scale(w, h), (w, h))
+                self.screen = pygame.display.get_surface()
+                game.relayout(self.screen)
+
+        with prof.section("update"):
+            game.update(dt)
+        dirty = game.take_dirty()
+        if prof.visible or self.continuous:
+            dirty = [self.screen.get_rect()]
+        if dirty:
+            with prof.section("draw"):
+                game.draw(self.screen)
+            prof.draw_overlay(self.screen, self.overlay_font)
+            with prof.section("flip"):
+                pygame.display.update(dirty)
+        prof.end_frame()
+        return dirty
+
+
+def open_stats():
+    try:
+        return stats.StatsStore()
+    except OSError as exc:
+        print(f"Stats disabled: {exc}")
+        return None
+
+
+def start_book_build(future, pack):
+    """Hints for the first two rows come from the opening book; build it in another process if the list changed."""
+    if future.exception() is None and openings.load_opening_book(future.result().words) is None:
+        openings.build_in_background(pack)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list_packs:
+        for name, pack in backend.list_packs().items():
+            print(f"{name:<12} {pack.language:<6} {pack.length} letters{'' if pack.answers_path else ', no separate answers'}")
+        return
+    pack = backend.get_pack(args.pack)
+    vocab = VOCAB
+    if (args.pack or None) != ENV_PACK:
+        vocab = backend.load_vocabulary_async(args.pack)
     pygame.init()
     pygame.display.set_caption("Wordle")
 
@@ -11,75 +232,64 @@ def main():
     max_w = int(screen_w * 0.8)
     max_h = int(screen_h * 0.8)
 
+    frontend.set_boards(args.boards)
+    frontend.set_word_length(pack.length)
     scale = frontend.compute_best_scale(max_w, max_h)
 
     frontend.setup_fonts(scale)
-    SCREEN = pygame.display.set_mode((frontend.WIDTH, frontend.HEIGHT))
+    SCREEN = pygame.display.set_mode((frontend.WIDTH, frontend.HEIGHT), pygame.RESIZABLE)
     CLOCK = pygame.time.Clock()
 
-    VOCAB = backend.get_vocab()
-    TARGET = backend.pick_daily_word(VOCAB)
-    try:
-        print(f"Word: {TARGET}")
-    except Exception:
-        pass
-
-    game = frontend.Game(TARGET, VOCAB, SCREEN)
-
-    running = True
-    while running:
-        dt = CLOCK.tick(frontend.FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if getattr(game, 'win', False) or getattr(game, 'lose', False):
-                    if event.key == pygame.K_SPACE:
-                        new_vocab = backend.get_vocab(reload=True)
-                        new_target = backend.pick_daily_word(new_vocab)
-                        try:
-                            print(f"Word: {new_target}")
-                        except Exception:
-                            pass
-                        game = frontend.Game(new_target, new_vocab, SCREEN)
-                        continue
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
-                        continue
-                    else:
-                        continue
-                frontend.handle_key(game, event)
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if getattr(game, 'win', False) or getattr(game, 'lose', False):
-                    if getattr(game, 'restart_rect', None) and game.restart_rect.collidepoint(event.pos):
-                        new_vocab = backend.get_vocab(reload=True)
-                        new_target = backend.pick_daily_word(new_vocab)
-                        try:
-                            print(f"Word: {new_target}")
-                        except Exception:
-                            pass
-                        game = frontend.Game(new_target, new_vocab, SCREEN)
-                        continue
-                    if getattr(game, 'quit_rect', None) and game.quit_rect.collidepoint(event.pos):
-                        running = False
-                        break
-
-                label = game.keyboard.key_at(event.pos)
-                if label:
-                    print(f"Clicked label: {label}")
-                    if label in ("ENTER", "Enter"):
-                        game.submit()
-                    elif label in ("⌫", "Delete", "Del", "DEL"):
-                        game.backspace()
-                    else:
-                        ch = label
-                        if isinstance(ch, str) and len(ch) == 1:
-                            game.add_char(ch)
-
-        game.update(dt)
-        game.draw(SCREEN)
-        pygame.display.flip()
+    prof = profiler.NULL
+    overlay_font = None
+    if args.profile or args.profile_out:
+        prof = profiler.FrameProfiler(keep_all=bool(args.profile_out))
+        prof.visible = True
+        frontend.PROFILER = prof
+        overlay_font = pygame.font.SysFont("monospace", 13)
+
+    seed = random.randrange(2 ** 31) if args.seed is None else args.seed
+    rec = None
+    if args.record:
+        rec = recorder.Recorder(args.record, seed=seed, hard=args.hard, adversarial=args.adversarial,
+                                continuous=args.continuous,
+                                boards=args.boards, size=[frontend.WIDTH, frontend.HEIGHT], scale=frontend.SCALE,
+                                pack=pack.name)
+    app = App(SCREEN, vocab, hard_mode=args.hard, seed=seed, continuous=args.continuous,
+              prof=prof, overlay_font=overlay_font, recorder=rec, boards=args.boards, pack=pack.name,
+              stats=None if args.no_stats else open_stats(), adversarial=args.adversarial)
+
+    ready = VOCAB_READY
+    if vocab is not VOCAB:
+        ready = []
+        vocab.add_done_callback(lambda _: ready.append(time.perf_counter()))
+    vocab.add_done_callback(lambda _: print(f"Word list ready after {(ready[0] - STARTED) * 1000:.0f} ms"))
+    vocab.add_done_callback(lambda f: start_book_build(f, pack.name))
+    first_frame = True
+    while app.running:
+        events = []
+        wakeup = 0.0 if args.continuous else app.game.next_wakeup()
+        if wakeup != 0.0 and not pygame.event.peek():
+            # nothing is animating: sleep until input arrives or a toast expires
+            if wakeup is None:
+                events.append(pygame.event.wait())
+            else:
+                events.append(pygame.event.wait(max(1, int(wakeup * 1000))))
+            app.game.update(CLOCK.tick() / 1000.0)
+            dt = 0.0
+        else:
+            dt = CLOCK.tick(frontend.FPS) / 1000.0
+        app.frame([e for e in events if e.type != pygame.NOEVENT] + pygame.event.get(), dt)
+        if first_frame:
+            first_frame = False
+            print(f"First frame after {(time.perf_counter() - STARTED) * 1000:.0f} ms")
 
+    if rec:
+        rec.close()
+        print(f"Input recorded to {args.record}")
+    if args.profile_out:
+        prof.dump_csv(args.profile_out)
+        print(f"Frame timings written to {args.profile_out}")
     pygame.quit()
 
 
@@ -0,0 +1,170 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+import numpy as np
+
+import backend
+import solver
+
+VERSION = 1
+
+# guess x answer cells scored per entropies call while building
+_BLOCK_CELLS = 1 << 22
+
+
+class OpeningBook:
+    """Best first guess for a word list and the best second guess after each of its patterns.
+
+    Unlike ``Solver.suggest`` the search is exhaustive: every word is scored
+    against every remaining answer, which is too slow for a frame but only
+    has to happen once per word list.
+    """
+
+    def __init__(self, opener, replies, vocab_hash):
+        self.opener = opener
+        self.replies = replies
+        self.vocab_hash = vocab_hash
+
+    def lookup(self, history, hard_mode=False):
+        """Book move after ``history`` of ``(guess, states)``, or None once out of the book.
+
+        In hard mode only the opener is used: a reply may ignore the hints
+        of the first row.
+        """
+        if not history:
+            return self.opener
+        if len(history) == 1 and not hard_mode:
+            guess, states = history[0]
+            if guess.lower() == self.opener:
+                return self.replies.get(backend.pattern_code(states))
+        return None
+
+
+def best_guess(s, answers):
+    """Highest-information word of the whole list against ``answers``, a possible answer on ties."""
+    if len(answers) <= 2:
+        return s.words[answers[0]]
+    n = len(s.words)
+    step = max(1, _BLOCK_CELLS // len(answers))
+    scores = np.concatenate([s.entropies(np.arange(i, min(i + step, n)), answers) for i in range(0, n, step)])
+    is_answer = np.zeros(n, dtype=bool)
+    is_answer[answers] = True
+    scores += is_answer * 1e-6
+    return s.words[int(np.argmax(scores))]
+
+
+def build_opening_book(vocab, patterns=None):
+    s = solver.Solver(vocab, patterns=patterns)
+    everything = np.arange(len(s.words))
+    opener = best_guess(s, everything)
+    codes = s.partition(opener, everything)
+    replies = {int(code): best_guess(s, everything[codes == code]) for code in np.unique(codes)}
+    return OpeningBook(opener, replies, backend.vocab_hash(s.words))
+
+
+def _book_path(digest, cache_dir=None):
+    return os.path.join(cache_dir or backend.CACHE_DIR, f"openings-{digest[:16]}.json")
+
+
+def load_opening_book(words, cache_dir=None):
+    """The stored book for exactly this word list, or None."""
+    digest = backend.vocab_hash(words)
+    try:
+        with open(_book_path(digest, cache_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != VERSION or data.get("vocab") != digest:
+        return None
+    return OpeningBook(data["opener"], {int(k): v for k, v in data["replies"].items()}, digest)
+
+
+def save_opening_book(book, cache_dir=None):
+    path = _book_path(book.vocab_hash, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {"version": VERSION, "vocab": book.vocab_hash, "opener": book.opener,
+            "replies": {str(k): v for k, v in sorted(book.replies.items())}}
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+
+
+def get_opening_book(vocab, patterns=None, cache_dir=None):
+    """Load the book for ``vocab`` from the cache, building and storing it when the word list changed.
+
+    Books are named after the vocabulary hash like the pattern tables, so an
+    edited list simply misses the cache and gets a fresh book.
+    """
+    if not isinstance(vocab, backend.Vocabulary):
+        vocab = backend.Vocabulary(vocab)
+    book = load_opening_book(vocab.words, cache_dir)
+    if book is None:
+        if patterns is None:
+            patterns = backend.load_pattern_matrix(vocab.words, cache_dir)
+        book = build_opening_book(vocab, patterns)
+        save_opening_book(book, cache_dir)
+    return book
+
+
+_BOOKS = {}
+
+
+def find_opening_book(vocab):
+    """Stored book for ``vocab``, or None; books once found stay in memory."""
+    digest = backend.vocab_hash(vocab.words)
+    book = _BOOKS.get(digest)
+    if book is None:
+        book = load_opening_book(vocab.words)
+        if book is not None:
+            _BOOKS[digest] = book
+    return book
+
+
+def build_in_background(pack=None):
+    """Build the book for ``pack`` in a separate, low priority process and return it.
+
+    The search keeps a core busy for several seconds; in its own process it
+    does not hold the game's GIL and the next game picks the stored book up.
+    """
+    cmd = [sys.executable, os.path.abspath(__file__), "--nice"]
+    if pack:
+        cmd += ["--pack", pack]
+    return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the opening book for a word list")
+    parser.add_argument("--pack", help="word pack to build for (default: the built-in English list)")
+    parser.add_argument("--rebuild", action="store_true", help="ignore a stored book")
+    parser.add_argument("--nice", action="store_true", help="run at a lower CPU priority where supported")
+    args = parser.parse_args(argv)
+    if args.nice and hasattr(os, "nice"):
+        os.nice(10)
+
+    vocab = backend.get_pack(args.pack).vocabulary()
+    start = time.perf_counter()
+    if args.rebuild:
+        book = build_opening_book(vocab, backend.load_pattern_matrix(vocab.words))
+        save_opening_book(book)
+    else:
+        book = get_opening_book(vocab)
+    elapsed = time.perf_counter() - start
+    print(f"opener: {book.opener} ({len(book.replies)} replies, {elapsed:.2f}s)")
+    length = len(book.opener)
+    # the most common first-row patterns and their replies
+    counts = np.bincount(solver.Solver(vocab).partition(book.opener, np.arange(len(vocab))))
+    for code in np.argsort(counts)[::-1][:10]:
+        if not counts[code]:
+            break
+        states = "".join(".yg"[st] for st in backend.decode_pattern(code, length))
+        print(f"  {states}  {counts[code]:>6} words -> {book.replies[int(code)]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import pygame
+
+FRAME = "frame"
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(q / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+class FrameProfiler:
+    """Per-frame section timings with a rolling window for the overlay.
+
+    Every finished frame is a dict of section name to milliseconds; the last
+    ``window`` frames feed the percentiles and, when ``keep_all`` is set,
+    every frame is kept for ``dump_csv``.
+    """
+
+    enabled = True
+
+    def __init__(self, window=600, keep_all=False):
+        self.window = deque(maxlen=window)
+        self.frames = [] if keep_all else None
+        self.sections = []
+        self.visible = False
+        self._current = {}
+        self._frame_start = None
+
+    def begin_frame(self):
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return
+        self._current[FRAME] = (time.perf_counter() - self._frame_start) * 1000.0
+        self.window.append(self._current)
+        if self.frames is not None:
+            self.frames.append(self._current)
+        self._frame_start = None
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000.0
+            if name not in self._current and name not in self.sections:
+                self.sections.append(name)
+            self._current[name] = self._current.get(name, 0.0) + ms
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def stats(self, name=FRAME):
+        values = sorted(f.get(name, 0.0) for f in self.window)
+        return percentile(values, 50), percentile(values, 95), percentile(values, 99)
+
+    def summary(self):
+        lines = []
+        for name in [FRAME] + self.sections:
+            p50, p95, p99 = self.stats(name)
+            lines.append(f"{name:<10} p50 {p50:6.2f}  p95 {p95:6.2f}  p99 {p99:6.2f} ms")
+        return lines
+
+    def draw_overlay(self, surface, font):
+        if not self.visible or not self.window:
+            return
+        lines = [f"{len(self.window)} frames"] + self.summary()
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        pad = 6
+        w = max(r.get_width() for r in rendered) + pad * 2
+        h = sum(r.get_height() for r in rendered) + pad * 2
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = pad
+        for r in rendered:
+            panel.blit(r, (pad, y))
+            y += r.get_height()
+        surface.blit(panel, (4, 4))
+
+    def dump_csv(self, path):
+        frames = self.frames if self.frames is not None else list(self.window)
+        columns = [FRAME] + self.sections
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["index"] + columns)
+            for i, frame in enumerate(frames):
+                writer.writerow([i] + [f"{frame.get(c, 0.0):.4f}" for c in columns])
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every call is a no-op."""
+
+    enabled = False
+    visible = False
+    _section = nullcontext()
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def section(self, name):
+        return self._section
+
+    def toggle(self):
+        pass
+
+    def draw_overlay(self, surface, font):
+        pass
+
+    def dump_csv(self, path):
+        pass
+
+
+NULL = NullProfiler()
@@ -0,0 +1,89 @@
+import json
+import time
+
+import pygame
+
+# 2: the game seed is drawn before the answers, so older logs replay other games
+VERSION = 2
+
+# event attributes worth keeping; anything else is rebuilt by pygame or unused
+_FIELDS = ("key", "mod", "unicode", "scancode", "pos", "button", "size", "w", "h")
+
+
+def event_to_dict(event):
+    data = {"type": pygame.event.event_name(event.type)}
+    for name in _FIELDS:
+        value = getattr(event, name, None)
+        if value is not None:
+            data[name] = list(value) if isinstance(value, tuple) else value
+    return data
+
+
+_TYPES = {}
+
+
+def event_from_dict(data):
+    if not _TYPES:
+        for name in dir(pygame):
+            value = getattr(pygame, name)
+            if name.isupper() and isinstance(value, int) and 0 < value < pygame.NUMEVENTS:
+                _TYPES.setdefault(pygame.event.event_name(value), value)
+    attrs = {k: tuple(v) if isinstance(v, list) else v for k, v in data.items() if k != "type"}
+    return pygame.event.Event(_TYPES[data["type"]], attrs)
+
+
+class Recorder:
+    """Append-only JSON lines log of one window session.
+
+    The first line is a header (seed, window size); then every started game
+    and every input event follows with its time in seconds since the
+    recording began. Header fields only known later, like the word list hash
+    once the list has loaded, are added with ``add_header``.
+    """
+
+    def __init__(self, path, **header):
+        self.path = path
+        self.file = open(path, "w", encoding="utf-8")
+        self.start = time.perf_counter()
+        self.header = {"version": VERSION, **header}
+        self._write(self.header)
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def _write(self, record):
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def add_header(self, **fields):
+        fields = {k: v for k, v in fields.items() if self.header.get(k) != v}
+        if fields:
+            self.header.update(fields)
+            self._write({"t": round(self.elapsed(), 6), "header": fields})
+
+    def game(self, answer):
+        self._write({"t": round(self.elapsed(), 6), "game": answer})
+
+    def event(self, event):
+        self._write({"t": round(self.elapsed(), 6), "event": event_to_dict(event)})
+
+    def close(self):
+        self.file.close()
+
+
+def load_recording(path):
+    """Return ``(header, records)`` of a log written by ``Recorder``, with later header fields merged in."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    version = lines[0].get("version") if lines else None
+    if version != VERSION:
+        if isinstance(version, int) and version < VERSION:
+            raise ValueError(f"{path} is a version {version} recording; this build only replays version {VERSION}")
+        raise ValueError(f"{path} is not a version {VERSION} recording")
+    header = dict(lines[0])
+    records = []
+    for record in lines[1:]:
+        if "header" in record:
+            header.update(record["header"])
+        else:
+            records.append(record)
+    return header, records
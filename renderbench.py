@@ -0,0 +1,283 @@
+import os
+import sys
+import json
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import backend  # noqa: E402
+import bench  # noqa: E402
+import frontend  # noqa: E402
+import profiler  # noqa: E402
+import stats  # noqa: E402
+
+DISPLAYS = "800x600,1366x768,1920x1080"
+
+# functions timed inside every frame: (owner, attribute, label)
+TIMED = (
+    (frontend.Tile, "draw", "Tile.draw"),
+    (frontend.Keyboard, "draw", "Keyboard.draw"),
+    (frontend, "draw_vertical_gradient", "draw_vertical_gradient"),
+)
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    """Register ``setup(game, words)``; it returns ``step(game, frame)`` run before every update."""
+    def register(setup):
+        SCENARIOS[name] = setup
+        return setup
+    return register
+
+
+def type_word(game, word):
+    for ch in word:
+        game.add_char(ch)
+
+
+def win(game, words):
+    for answer in game.answers:
+        if not game.win:
+            type_word(game, answer)
+            game.submit()
+
+
+@scenario("idle")
+def _(game, words):
+    return lambda game, frame: None
+
+
+@scenario("typing")
+def _(game, words):
+    # one key every few frames, so a pop is always running; the row restarts when full
+    def step(game, frame):
+        if frame % 4:
+            return
+        if game.col == frontend.COLS:
+            for _ in range(frontend.COLS):
+                game.backspace()
+        game.add_char(words["guess"][game.col])
+    return step
+
+
+@scenario("flips")
+def _(game, words):
+    type_word(game, words["guess"])
+    game.submit()
+    game.particles = frontend.Particles(seed=0)
+
+    def step(game, frame):
+        row = [grid[0] for grid in game.boards]
+        if row[0][0].flip_t == 0:
+            for tiles in row:
+                for tile in tiles:
+                    tile.start_flip()
+    return step
+
+
+@scenario("shake")
+def _(game, words):
+    type_word(game, words["guess"][:-1])
+
+    def step(game, frame):
+        if game.shake_t == 0:
+            game.shake()
+    return step
+
+
+@scenario("confetti")
+def _(game, words):
+    win(game, words)
+
+    def step(game, frame):
+        if len(game.particles) < frontend.CONFETTI_COUNT // 2:
+            game.spawn_confetti()
+    return step
+
+
+@scenario("modal")
+def _(game, words):
+    win(game, words)
+    game.particles = frontend.Particles(seed=0)
+    game.stats = sample_stats(words)
+    return lambda game, frame: None
+
+
+def sample_stats(words):
+    s = stats.Stats()
+    for turns in (2, 3, 3, 4, 4, 4, 5, 0):
+        s.add(words["answers"][0], [words["guess"]] * max(turns, 1), turns)
+    return s
+
+
+def pick_words(vocab, boards):
+    step = len(vocab) // boards
+    answers = [vocab[i * step + step // 2] for i in range(boards)]
+    guess = next(w for w in ("tares", "crane") + tuple(vocab) if w in vocab and w not in answers)
+    return {"answers": answers, "guess": guess}
+
+
+class FunctionTimer:
+    """Wraps the ``TIMED`` functions to add up their calls and time while active."""
+
+    def __init__(self):
+        self.calls = {label: 0 for _, _, label in TIMED}
+        self.seconds = {label: 0.0 for _, _, label in TIMED}
+        self.active = False
+        self._saved = []
+
+    def wrap(self, fn, label):
+        def timed(*args, **kwargs):
+            if not self.active:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.seconds[label] += time.perf_counter() - start
+                self.calls[label] += 1
+        return timed
+
+    def install(self):
+        for owner, name, label in TIMED:
+            fn = getattr(owner, name)
+            self._saved.append((owner, name, fn))
+            setattr(owner, name, self.wrap(fn, label))
+
+    def uninstall(self):
+        for owner, name, fn in self._saved:
+            setattr(owner, name, fn)
+        self._saved = []
+
+    def reset(self):
+        for label in self.calls:
+            self.calls[label] = 0
+            self.seconds[label] = 0.0
+
+
+def run_scenario(name, vocab, words, screen, frames, warmup, dt, timer):
+    """Drive one scenario for ``warmup + frames`` frames; only the last ``frames`` are timed.
+
+    The background layer is dropped before the timed frames so each run
+    includes one rebuild of it, as after a resize.
+    """
+    answers = words["answers"]
+    game = frontend.Game(answers[0] if len(answers) == 1 else answers, vocab, screen, seed=0)
+    step = SCENARIOS[name](game, words)
+    times = []
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            frontend._STATIC_LAYER = None
+            timer.reset()
+            timer.active = True
+        start = time.perf_counter()
+        step(game, frame)
+        game.update(dt)
+        game.draw(screen)
+        pygame.display.update(game.take_dirty())
+        if frame >= warmup:
+            times.append(time.perf_counter() - start)
+    timer.active = False
+    times.sort()
+    total = sum(times)
+    return {
+        "seconds": total / frames,
+        "fps": frames / total,
+        "p50_ms": profiler.percentile(times, 50) * 1000,
+        "p95_ms": profiler.percentile(times, 95) * 1000,
+        "functions": {label: {"calls": timer.calls[label], "seconds": timer.seconds[label]}
+                      for label in timer.calls},
+    }
+
+
+def scales_for(displays):
+    """Scales ``main.py`` would pick on these screens (80% of the display), without duplicates."""
+    scales = []
+    for display in displays.split(","):
+        w, h = (int(v) for v in display.lower().split("x"))
+        scale = round(frontend.compute_best_scale(int(w * 0.8), int(h * 0.8)), 2)
+        if scale not in scales:
+            scales.append(scale)
+    return scales
+
+
+def run(names, scales, vocab, boards, frames, warmup, dt, out=sys.stdout):
+    words = pick_words(vocab, boards)
+    timer = FunctionTimer()
+    timer.install()
+    results = {}
+    labels = [label for _, _, label in TIMED]
+    try:
+        for scale in scales:
+            frontend.setup_fonts(scale)
+            screen = pygame.display.set_mode((frontend.WIDTH, frontend.HEIGHT))
+            print(f"\nscale {scale:.2f} ({frontend.WIDTH}x{frontend.HEIGHT}, {boards} board(s))", file=out)
+            print(f"{'scenario':<10} {'fps':>8} {'p50 ms':>8} {'p95 ms':>8} "
+                  + " ".join(f"{label:>24}" for label in labels), file=out)
+            for name in names:
+                res = run_scenario(name, vocab, words, screen, frames, warmup, dt, timer)
+                key = f"render.{name}.s{scale:.2f}" + (f".b{boards}" if boards > 1 else "")
+                results[key] = res
+                cells = []
+                for label in labels:
+                    fn = res["functions"][label]
+                    per_call = fn["seconds"] / fn["calls"] * 1e6 if fn["calls"] else 0.0
+                    cells.append(f"{fn['seconds'] / frames * 1000:8.3f} ms/f {per_call:7.1f} us")
+                print(f"{name:<10} {res['fps']:8.0f} {res['p50_ms']:8.2f} {res['p95_ms']:8.2f} "
+                      + " ".join(f"{c:>24}" for c in cells), file=out)
+    finally:
+        timer.uninstall()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless rendering benchmark over scripted game scenarios")
+    parser.add_argument("-k", "--filter", default="", help="only run scenarios whose name contains this")
+    parser.add_argument("--displays", default=DISPLAYS,
+                        help=f"screen sizes to derive scales from, as WxH,... (default {DISPLAYS})")
+    parser.add_argument("--scales", help="comma separated scales to use instead of --displays")
+    parser.add_argument("--boards", type=int, choices=(1, 2, 4, 8), default=1)
+    parser.add_argument("--pack", help="word pack to play (default: the built-in English list)")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=30, help="untimed frames before each scenario")
+    parser.add_argument("--dt", type=float, default=1.0 / 60, help="game seconds per frame (default 1/60)")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail if slower than this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a result counts as a regression (default 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    frontend.set_boards(args.boards)
+    pack = backend.get_pack(args.pack)
+    vocab = pack.vocabulary()
+    frontend.set_word_length(pack.length)
+    names = [n for n in SCENARIOS if args.filter in n]
+    if args.scales:
+        scales = [float(s) for s in args.scales.split(",")]
+    else:
+        scales = scales_for(args.displays)
+    results = run(names, scales, vocab, args.boards, args.frames, args.warmup, args.dt)
+    pygame.quit()
+
+    if args.save:
+        meta = dict(bench.metadata(), pygame=pygame.version.ver, boards=args.boards, frames=args.frames)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        regressions = bench.compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
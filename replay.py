@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import backend  # noqa: E402
+import frontend  # noqa: E402
+import profiler  # noqa: E402
+import recorder  # noqa: E402
+from main import App, VOCAB  # noqa: E402
+
+
+def replay(path, dt=1.0 / 60, prof=profiler.NULL, tail=2.0):
+    """Play a recording back as fast as possible with a fixed time step.
+
+    Events are delivered on the first frame at or after their timestamp and
+    frames keep running for ``tail`` seconds of game time after the last one
+    so the final animations finish. Returns ``(frames, drawn, seconds)``.
+    """
+    header, records = recorder.load_recording(path)
+    pygame.init()
+    w, h = header["size"]
+    pack = backend.get_pack(header.get("pack"))
+    frontend.set_boards(header.get("boards", 1))
+    frontend.set_word_length(pack.length)
+    frontend.setup_fonts(header["scale"], (w, h))
+    screen = pygame.display.set_mode((w, h))
+    VOCAB.result()  # let the loader started by main finish instead of racing it
+    vocab = pack.vocabulary()
+    if header.get("vocab") != backend.vocab_hash(vocab.words):
+        print("warning: the word list changed since this was recorded", file=sys.stderr)
+
+    # adversarial games have no answer until they end
+    answers = [r["game"] for r in records if r.get("game")]
+    events = [(r["t"], recorder.event_from_dict(r["event"])) for r in records if "event" in r]
+    app = App(screen, vocab, hard_mode=header.get("hard", False), seed=header["seed"],
+              continuous=header.get("continuous", False), prof=prof, boards=header.get("boards", 1), pack=pack.name,
+              adversarial=header.get("adversarial", False))
+    end = (events[-1][0] if events else 0.0) + tail
+
+    frames = drawn = 0
+    i = 0
+    start = time.perf_counter()
+    while app.running and frames * dt <= end:
+        now = frames * dt
+        batch = []
+        while i < len(events) and events[i][0] <= now:
+            event = events[i][1]
+            if event.type == pygame.VIDEORESIZE:
+                # the dummy driver does not resize the window on its own
+                pygame.display.set_mode(event.size)
+            batch.append(event)
+            i += 1
+        if app.frame(batch, dt):
+            drawn += 1
+        frames += 1
+    seconds = time.perf_counter() - start
+    if answers and app.game.answer != answers[-1]:
+        print(f"warning: replay ended on '{app.game.answer}', recording on '{answers[-1]}'", file=sys.stderr)
+    pygame.quit()
+    return frames, drawn, seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless and uncapped")
+    parser.add_argument("recording", help="log written by main.py --record")
+    parser.add_argument("--dt", type=float, default=1.0 / 60, help="game seconds per frame (default 1/60)")
+    parser.add_argument("--tail", type=float, default=2.0, help="game seconds to keep running after the last event")
+    parser.add_argument("--profile-out", metavar="PATH", help="write per-frame timings as CSV")
+    args = parser.parse_args(argv)
+
+    prof = profiler.FrameProfiler(keep_all=True)
+    frontend.PROFILER = prof
+    frames, drawn, seconds = replay(args.recording, args.dt, prof, args.tail)
+    print(f"{frames} frames ({drawn} drawn) in {seconds:.2f} s: {frames / seconds:.0f} frames/s")
+    print("\n".join(prof.summary()))
+    if args.profile_out:
+        prof.dump_csv(args.profile_out)
+        print(f"Frame timings written to {args.profile_out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
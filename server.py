@@ -0,0 +1,229 @@
+import json
+import asyncio
+import secrets
+import argparse
+from collections import OrderedDict
+
+import backend
+
+try:
+    import resource  # Unix only; the stats endpoint reports no memory use elsewhere
+except ImportError:
+    resource = None
+
+ROWS = 6
+MAX_BODY = 4096
+
+# letter codes 0-25 <-> ASCII
+_TO_ASCII = bytes((i + 97) % 256 for i in range(256))
+_FROM_ASCII = bytes((i - 97) % 256 for i in range(256))
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+            431: "Request Header Fields Too Large"}
+
+
+class Session:
+    """One player's game: answer and guesses as letter codes, results as pattern codes."""
+
+    __slots__ = ("answer", "guesses", "patterns", "day", "done")
+
+    def __init__(self, answer, day):
+        self.answer = answer.encode('ascii').translate(_FROM_ASCII)
+        self.guesses = bytearray()
+        self.patterns = bytearray()
+        self.day = day
+        self.done = False
+
+    @property
+    def rows(self):
+        return len(self.patterns)
+
+    @property
+    def win(self):
+        return bool(self.patterns) and self.patterns[-1] == backend.N_PATTERNS - 1
+
+    def answer_word(self):
+        return self.answer.translate(_TO_ASCII).decode('ascii')
+
+    def guess(self, word):
+        states = backend.Judge.evaluate(word, self.answer_word())
+        self.guesses += word.encode('ascii').translate(_FROM_ASCII)
+        self.patterns.append(backend.pattern_code(states))
+        self.done = self.win or self.rows >= ROWS
+        return states
+
+    def to_json(self, sid):
+        n = backend.WORD_LEN
+        words = self.guesses.translate(_TO_ASCII).decode('ascii')
+        data = {
+            "id": sid,
+            "day": self.day,
+            "guesses": [words[i * n:(i + 1) * n] for i in range(self.rows)],
+            "states": [backend.decode_pattern(p) for p in self.patterns],
+            "win": self.win,
+            "done": self.done,
+        }
+        if self.done:
+            data["answer"] = self.answer_word()
+        return data
+
+
+class GameServer:
+    def __init__(self, vocab=None, max_sessions=500_000):
+        self.vocab = vocab if vocab is not None else backend.get_vocabulary()
+        self.sessions = OrderedDict()
+        self.max_sessions = max_sessions
+        self.requests = 0
+        self._today = (None, None)
+
+    def answer_for(self, day):
+        if self._today[0] != day:
+            self._today = (day, backend.pick_daily_word(self.vocab, day=day))
+        return self._today[1]
+
+    def create(self, day=None):
+        day = backend.day_number() if day is None else int(day)
+        sid = secrets.token_hex(8)
+        self.sessions[sid] = Session(self.answer_for(day), day)
+        if len(self.sessions) > self.max_sessions:
+            # forget the least recently created session
+            self.sessions.popitem(last=False)
+        return sid
+
+    def handle(self, method, path, body):
+        self.requests += 1
+        parts = [p for p in path.split("?")[0].split("/") if p]
+        if parts == ["session"]:
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            day = body.get("day")
+            # bool is an int subclass, but {"day": true} is not a day
+            if day is not None and (isinstance(day, bool) or not isinstance(day, int)):
+                return 400, {"error": "day must be an integer"}
+            sid = self.create(day)
+            return 201, self.sessions[sid].to_json(sid)
+        if len(parts) >= 2 and parts[0] == "session":
+            session = self.sessions.get(parts[1])
+            if session is None:
+                return 404, {"error": "unknown session"}
+            if len(parts) == 2 and method == "GET":
+                return 200, session.to_json(parts[1])
+            if parts[2:] == ["guess"] and method == "POST":
+                return self.guess(session, body.get("guess"))
+            return 405, {"error": "unsupported method"}
+        if parts == ["stats"]:
+            return 200, {
+                "sessions": len(self.sessions),
+                "requests": self.requests,
+                "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+            }
+        return 404, {"error": "not found"}
+
+    def guess(self, session, word):
+        if session.done:
+            return 409, {"error": "game is over"}
+        if not isinstance(word, str):
+            return 400, {"error": "guess must be a string"}
+        if len(word) < backend.WORD_LEN:
+            return 400, {"error": "Not enough letters"}
+        if len(word) > backend.WORD_LEN:
+            return 400, {"error": "Too many letters"}
+        if not (word.isascii() and word.isalpha()):
+            return 400, {"error": "Only letters a-z are allowed"}
+        word = word.lower()
+        if word not in self.vocab:
+            return 400, {"error": "Not in word list"}
+        states = session.guess(word)
+        data = {"states": states, "row": session.rows, "win": session.win, "done": session.done}
+        if session.done:
+            data["answer"] = session.answer_word()
+        return 200, data
+
+    async def read_head(self, reader):
+        """Method, path, Content-Length and keep-alive of the next request, or None at its end.
+
+        Raises ValueError when a line is longer than the stream's limit.
+        """
+        request_line = await reader.readline()
+        try:
+            method, path, _ = request_line.decode('latin-1').split(" ", 2)
+        except ValueError:
+            return None
+        length = 0
+        keep_alive = True
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value.strip()) if value.strip().isdigit() else MAX_BODY + 1
+            elif name == "connection":
+                keep_alive = value.strip().lower() != "close"
+        return method, path, length, keep_alive
+
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self.read_head(reader)
+                except ValueError:
+                    # the rest of the over-long line is still unread, so answer and close
+                    status, payload = 431, {"error": "request line or header too long"}
+                    keep_alive = False
+                else:
+                    if request is None:
+                        break
+                    method, path, length, keep_alive = request
+                    if length > MAX_BODY:
+                        status, payload = 413, {"error": "body too large"}
+                        keep_alive = False
+                    else:
+                        raw = await reader.readexactly(length) if length else b""
+                        try:
+                            body = json.loads(raw) if raw else {}
+                            if not isinstance(body, dict):
+                                raise ValueError
+                        except ValueError:
+                            status, payload = 400, {"error": "invalid JSON"}
+                        else:
+                            status, payload = self.handle(method.upper(), path, body)
+                out = json.dumps(payload, separators=(",", ":")).encode('utf-8')
+                head = (f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}\r\n"
+                        f"Content-Type: application/json\r\nContent-Length: {len(out)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode('latin-1') + out)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port, max_sessions):
+    game_server = GameServer(max_sessions=max_sessions)
+    server = await asyncio.start_server(game_server.serve_client, host, port, backlog=1024)
+    addr = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Serving Wordle on {addr} ({len(game_server.vocab)} words)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-session Wordle HTTP/JSON server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-sessions", type=int, default=500_000)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_sessions))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import sys
+import time
+import random
+import argparse
+import importlib
+from multiprocessing import Pool
+
+import backend
+import engine
+import openings
+import solver
+
+# read-only guess x answer table of the worker process, None when judging directly;
+# every worker maps the same file, so the OS keeps a single copy in the page cache
+PATTERNS = None
+# opening book of the worker process, None when disabled or not built
+BOOK = None
+
+
+class RandomStrategy:
+    """Guess a random word that is still consistent with the feedback."""
+
+    def __init__(self, vocab, rng):
+        self.vocab = vocab
+        self.rng = rng
+
+    def start(self, state):
+        pass
+
+    def guess(self, state):
+        ids = self.vocab.letters.indices(state.feedback_mask)
+        return self.vocab[int(ids[self.rng.randrange(len(ids))])]
+
+
+class EntropyStrategy:
+    """Play the solver's highest-information suggestion."""
+
+    def __init__(self, vocab, rng):
+        self.solver = solver.Solver(vocab, patterns=PATTERNS)
+        self.opener = BOOK.opener if BOOK else self.solver.suggest()
+
+    def start(self, state):
+        self.solver.reset()
+
+    def guess(self, state):
+        if not state.guesses:
+            return self.opener
+        self.solver.update(*state.guesses[-1])
+        constraints = state.constraints if state.hard_mode else None
+        if BOOK and len(state.guesses) == 1:
+            return BOOK.lookup(state.guesses, state.hard_mode) or self.solver.suggest(constraints)
+        return self.solver.suggest(constraints)
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "entropy": EntropyStrategy,
+}
+
+
+def load_strategy(name):
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown strategy {name!r}; use one of {sorted(STRATEGIES)} or module:Class")
+    return getattr(importlib.import_module(module), attr)
+
+
+def play(strategy, answer, vocab, hard_mode=False):
+    state = engine.GameState(answer, vocab, hard_mode=hard_mode, patterns=PATTERNS)
+    strategy.start(state)
+    while not state.over:
+        word = strategy.guess(state)
+        result = state.guess(word)
+        if not result.ok:
+            raise RuntimeError(f"Strategy played an invalid guess {word!r}: {result.message}")
+    return len(state.guesses) if state.win else 0
+
+
+def init_worker(use_patterns, use_book=False):
+    global PATTERNS, BOOK
+    PATTERNS = BOOK = None
+    words = backend.get_vocabulary().words
+    if use_patterns:
+        PATTERNS = backend.load_pattern_matrix(words)
+    if use_book:
+        BOOK = openings.load_opening_book(words)
+
+
+def run_worker(job):
+    strategy_name, seed, answers, n_games, hard_mode = job
+    rng = random.Random(seed)
+    vocab = backend.get_vocabulary()
+    strategy = load_strategy(strategy_name)(vocab, rng)
+    # histogram[n] counts wins in n guesses, histogram[0] counts losses
+    histogram = [0] * (engine.ROWS + 1)
+    if answers is None:
+        answers = (backend.pick_daily_word(vocab, rng) for _ in range(n_games))
+    for answer in answers:
+        histogram[play(strategy, answer, vocab, hard_mode)] += 1
+    return histogram
+
+
+def make_jobs(args, vocab, workers):
+    jobs = []
+    for w in range(workers):
+        seed = args.seed + w
+        if args.all:
+            jobs.append((args.strategy, seed, list(vocab.words[w::workers]), None, args.hard))
+        else:
+            n = args.games // workers + (1 if w < args.games % workers else 0)
+            jobs.append((args.strategy, seed, None, n, args.hard))
+    return jobs
+
+
+def evaluate(args, vocab, workers):
+    """Play the configured games on ``workers`` processes; returns ``(histogram, seconds)``."""
+    jobs = make_jobs(args, vocab, workers)
+    initargs = (not args.no_patterns, not args.no_book)
+    start = time.perf_counter()
+    if workers == 1:
+        init_worker(*initargs)
+        results = [run_worker(jobs[0])]
+    else:
+        with Pool(workers, initializer=init_worker, initargs=initargs) as pool:
+            results = pool.map(run_worker, jobs)
+    elapsed = time.perf_counter() - start
+    return [sum(col) for col in zip(*results)], elapsed
+
+
+def report(histogram, elapsed, out=sys.stdout):
+    games = sum(histogram)
+    wins = games - histogram[0]
+    print(f"games:      {games}", file=out)
+    print(f"win rate:   {100.0 * wins / max(1, games):.2f}%", file=out)
+    if wins:
+        mean = sum(n * c for n, c in enumerate(histogram)) / wins
+        print(f"mean turns: {mean:.3f}", file=out)
+    width = max(histogram)
+    for n in range(1, len(histogram)):
+        bar = "#" * int(40 * histogram[n] / max(1, width))
+        print(f"  {n}: {histogram[n]:>7} {bar}", file=out)
+    print(f"  X: {histogram[0]:>7}", file=out)
+    print(f"elapsed:    {elapsed:.2f}s ({games / max(elapsed, 1e-9):.1f} games/s)", file=out)
+
+
+def report_scaling(timings, games, out=sys.stdout):
+    """Throughput per worker count, relative to the first count measured."""
+    base_workers, base_elapsed = timings[0]
+    print(f"{'workers':>8} {'seconds':>9} {'games/s':>10} {'speedup':>8} {'efficiency':>10}", file=out)
+    for workers, elapsed in timings:
+        speedup = base_elapsed / elapsed
+        efficiency = speedup * base_workers / workers
+        print(f"{workers:>8} {elapsed:>9.2f} {games / elapsed:>10.1f} {speedup:>7.2f}x {efficiency:>10.0%}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play many headless Wordle games with a strategy")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--all", action="store_true", help="play every word in the vocabulary once")
+    parser.add_argument("--strategy", default="entropy",
+                        help=f"one of {', '.join(STRATEGIES)} or module:Class")
+    parser.add_argument("--workers", default="1",
+                        help="process count, or a comma separated list to report throughput scaling")
+    parser.add_argument("--seed", type=int, default=0, help="worker i uses seed + i")
+    parser.add_argument("--hard", action="store_true")
+    parser.add_argument("--no-patterns", action="store_true",
+                        help="judge every guess instead of sharing the precomputed pattern table")
+    parser.add_argument("--no-book", action="store_true",
+                        help="search the first two guesses instead of using the opening book")
+    args = parser.parse_args(argv)
+    counts = [max(1, int(n)) for n in args.workers.split(",") if n.strip()] or [1]
+
+    vocab = backend.get_vocabulary()
+    patterns = None
+    if not args.no_patterns:
+        # build once in the parent; workers only map the finished file
+        patterns = backend.build_pattern_matrix(vocab.words)
+    if not args.no_book:
+        openings.get_opening_book(vocab, patterns)
+    timings = []
+    for workers in counts:
+        histogram, elapsed = evaluate(args, vocab, workers)
+        timings.append((workers, elapsed))
+        if len(counts) > 1:
+            print(f"-- {workers} worker(s)")
+        report(histogram, elapsed)
+    if len(counts) > 1:
+        print()
+        report_scaling(timings, sum(histogram))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import numpy as np
+import backend
+
+# guess x answer cells scored per suggestion, keeps a hint inside one frame
+MAX_PAIRS = 200_000
+
+
+class Solver:
+    def __init__(self, vocab, patterns=None):
+        if not isinstance(vocab, backend.Vocabulary):
+            vocab = backend.Vocabulary(vocab)
+        self.vocab = vocab
+        self.words = vocab.words
+        self.codes = vocab.codes
+        self.patterns = patterns
+        # which letters each word contains, for shortlisting guesses
+        self.present = np.zeros((len(self.words), len(backend.ALPHABET)), dtype=bool)
+        self.present[np.arange(len(self.words))[:, None], self.codes] = True
+        self._xlogx = np.zeros(1)
+        self.reset()
+
+    def reset(self):
+        self.candidates = np.arange(len(self.words))
+        self.history = []
+
+    @property
+    def remaining(self):
+        return len(self.candidates)
+
+    def candidate_words(self):
+        return [self.words[i] for i in self.candidates]
+
+    def score(self, guess_ids, answer_ids):
+        if self.patterns is not None:
+            return np.asarray(self.patterns[np.ix_(guess_ids, answer_ids)])
+        return backend.Judge.evaluate_batch(self.codes[guess_ids], self.codes[answer_ids])
+
+    def partition(self, guess, candidates=None):
+        """Pattern code of ``guess`` against each candidate (current ones by default)."""
+        candidates = self.candidates if candidates is None else candidates
+        guess = guess.lower()
+        gid = self.vocab.index_of(guess)
+        if gid is not None and self.patterns is not None:
+            return np.asarray(self.patterns[gid, candidates])
+        return backend.Judge.evaluate_batch(guess, self.codes[candidates])[0]
+
+    def update(self, guess, states):
+        code = backend.pattern_code(states)
+        self.candidates = self.candidates[self.partition(guess) == code]
+        self.history.append((guess.lower(), list(states)))
+        return len(self.candidates)
+
+    def entropies(self, guess_ids, answer_ids):
+        pats = self.score(guess_ids, answer_ids)
+        n_guesses, n_answers = pats.shape
+        # keep the per-guess histogram narrow: renumber the patterns that occur,
+        # or with only a few answers number the runs of each sorted row instead
+        seen = np.zeros(3 ** self.codes.shape[1], dtype=bool)
+        seen[pats] = True
+        width = int(seen.sum())
+        if n_answers < width:
+            pats = np.sort(pats, axis=1)
+            groups = np.zeros(pats.shape, dtype=np.intp)
+            np.cumsum(pats[:, 1:] != pats[:, :-1], axis=1, out=groups[:, 1:])
+            width = n_answers
+        else:
+            groups = (np.cumsum(seen) - 1)[pats]
+        bins = groups + np.arange(n_guesses)[:, None] * width
+        counts = np.bincount(bins.ravel(), minlength=n_guesses * width).reshape(n_guesses, width)
+        if len(self._xlogx) <= n_answers:
+            x = np.arange(n_answers + 1, dtype=np.float64)
+            self._xlogx = x * np.log2(np.maximum(x, 1))
+        return np.log2(n_answers) - self._xlogx[counts].sum(axis=1) / n_answers
+
+    def shortlist(self, pool, cands, k):
+        """The ``k`` words of ``pool`` whose letters split ``cands`` most evenly."""
+        if len(pool) <= k:
+            return pool
+        have = self.present[cands].sum(axis=0)
+        split = np.minimum(have, len(cands) - have)
+        score = self.present[pool] @ split
+        return pool[np.argsort(-score, kind="stable")[:k]]
+
+    def suggest(self, constraints=None):
+        """Best guess for the current candidates; with ``constraints`` only words hard mode accepts."""
+        cands = self.candidates
+        if len(cands) == 0:
+            return None
+        if len(cands) <= 2:
+            return self.words[cands[0]]
+        pool = np.arange(len(self.words))
+        if constraints is not None:
+            # candidates always pass, so the pool never ends up empty
+            pool = pool[constraints.hard_mode_mask(self.codes)]
+        if len(cands) * len(pool) <= MAX_PAIRS:
+            answers = cands
+        else:
+            # about sqrt(MAX_PAIRS) each of shortlisted guesses and evenly strided answers
+            side = int(MAX_PAIRS ** 0.5)
+            answers = cands[::-(-len(cands) // side)]
+            pool = self.shortlist(pool, cands, MAX_PAIRS // len(answers))
+        scores = self.entropies(pool, answers)
+        # prefer a guess that can still be the answer when the information is equal
+        is_cand = np.zeros(len(self.words), dtype=bool)
+        is_cand[cands] = True
+        scores = scores + is_cand[pool] * 1e-6
+        return self.words[pool[int(np.argmax(scores))]]
@@ -0,0 +1,152 @@
+import os
+import time
+import struct
+
+import backend
+
+MAX_ROWS = 6
+MAX_LEN = backend.MAX_WORD_LEN
+
+# one finished game: time, turns (0 = lost), word length, guesses played, flags, answer, guesses
+_RECORD = struct.Struct(f"<qBBBB{MAX_LEN}s{MAX_ROWS * MAX_LEN}s")
+_HARD = 1
+
+_MAGIC = b"WDLS"
+_VERSION = 1
+# magic, version, log bytes folded in, games, wins, streak, max streak,
+# histogram (index 0 counts losses), per-letter hits and tiles guessed
+_CHECKPOINT = struct.Struct(f"<4sHQIIII{MAX_ROWS + 1}I26I26I")
+
+
+def stats_home():
+    return os.environ.get("WORDLE_HOME") or os.path.join(os.path.expanduser("~"), ".wordle")
+
+
+class Stats:
+    """Aggregates over every recorded game, updated one record at a time."""
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.streak = 0
+        self.max_streak = 0
+        self.histogram = [0] * (MAX_ROWS + 1)
+        self.letter_hits = [0] * 26
+        self.letter_total = [0] * 26
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    def letter_accuracy(self, ch):
+        """Share of tiles with this letter that came back yellow or green."""
+        i = ord(ch.lower()) - ord('a')
+        return self.letter_hits[i] / self.letter_total[i] if self.letter_total[i] else 0.0
+
+    def best_letters(self, n=3, min_tiles=5):
+        seen = [c for i, c in enumerate(backend.ALPHABET) if self.letter_total[i] >= min_tiles]
+        return sorted(seen, key=self.letter_accuracy, reverse=True)[:n]
+
+    def add(self, answer, guesses, turns):
+        self.games += 1
+        if turns:
+            self.wins += 1
+            self.streak += 1
+            self.max_streak = max(self.max_streak, self.streak)
+        else:
+            self.streak = 0
+        self.histogram[min(turns, MAX_ROWS)] += 1
+        for guess in guesses:
+            for state, ch in zip(backend.Judge.evaluate(guess, answer), guess):
+                i = ord(ch) - ord('a')
+                self.letter_total[i] += 1
+                self.letter_hits[i] += state > 0
+
+
+class StatsStore:
+    """Finished games in an append-only log of fixed-size binary records.
+
+    ``games.log`` is the history and ``stats.bin`` a checkpoint of the
+    aggregates together with how much of the log they cover. Opening the
+    store reads the checkpoint and folds in only the records written after
+    it, so loading costs the same after ten games or ten thousand.
+
+    Opening and recording raise ``OSError`` when the files cannot be written.
+    """
+
+    def __init__(self, home=None):
+        self.home = home or stats_home()
+        self.log_path = os.path.join(self.home, "games.log")
+        self.checkpoint_path = os.path.join(self.home, "stats.bin")
+        self._load()
+
+    def _load(self):
+        self.stats, self.offset = Stats(), 0
+        try:
+            with open(self.checkpoint_path, "rb") as f:
+                data = f.read(_CHECKPOINT.size)
+            fields = _CHECKPOINT.unpack(data)
+        except (OSError, struct.error):
+            fields = None
+        if fields and fields[:2] == (_MAGIC, _VERSION):
+            s = self.stats
+            self.offset, s.games, s.wins, s.streak, s.max_streak = fields[2:7]
+            rest = list(fields[7:])
+            s.histogram = rest[:MAX_ROWS + 1]
+            s.letter_hits = rest[MAX_ROWS + 1:MAX_ROWS + 27]
+            s.letter_total = rest[MAX_ROWS + 27:]
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            size = 0
+        if size % _RECORD.size:
+            # a record cut short by a crash: drop it so later appends stay aligned
+            size -= size % _RECORD.size
+            os.truncate(self.log_path, size)
+        if size < self.offset:
+            # the log was replaced or truncated: rebuild from scratch
+            self.stats, self.offset = Stats(), 0
+        if size - self.offset >= _RECORD.size:
+            self._fold_tail(size)
+
+    def _fold_tail(self, size):
+        with open(self.log_path, "rb") as f:
+            f.seek(self.offset)
+            while size - self.offset >= _RECORD.size:
+                self._apply(_RECORD.unpack(f.read(_RECORD.size)))
+                self.offset += _RECORD.size
+        self._checkpoint()
+
+    def _apply(self, record):
+        _, turns, length, played, _, answer, guesses = record
+        answer = answer[:length].decode('ascii')
+        guesses = guesses.decode('ascii')
+        words = [guesses[i * length:(i + 1) * length] for i in range(played)]
+        self.stats.add(answer, words, turns)
+
+    def _checkpoint(self):
+        s = self.stats
+        data = _CHECKPOINT.pack(_MAGIC, _VERSION, self.offset, s.games, s.wins, s.streak, s.max_streak,
+                                *s.histogram, *s.letter_hits, *s.letter_total)
+        tmp = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self.checkpoint_path)
+
+    def record(self, answer, guesses, win, hard_mode=False, when=None):
+        """Append one finished game and return the updated ``Stats``."""
+        length = len(answer)
+        guesses = list(guesses)[:MAX_ROWS]
+        turns = len(guesses) if win else 0
+        record = (int(time.time() if when is None else when), turns, length, len(guesses),
+                  _HARD if hard_mode else 0, answer.encode('ascii'), "".join(guesses).encode('ascii'))
+        os.makedirs(self.home, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            if f.tell() != self.offset:
+                # another process appended since we loaded; catch up first
+                self._load()
+            f.write(_RECORD.pack(*record))
+        self._apply(record)
+        self.offset += _RECORD.size
+        self._checkpoint()
+        return self.stats
@@ -0,0 +1,45 @@
+import os
+
+import backend
+
+
+def write_list(path, words, mtime_ns):
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_compiled_list_is_reused_until_the_source_changes(tmp_path, monkeypatch):
+    source = tmp_path / "words.txt"
+    compiled = str(tmp_path / "cache" / "words.bin")
+    write_list(source, ["Slate", "crane", "crane", "tares", "toolong"], 1_000_000_000)
+    assert backend.load_words(str(source), compiled) == ["crane", "slate", "tares"]
+    assert os.path.getsize(compiled) == backend._VOCAB_HEADER.size + 3 * 5
+
+    calls = []
+    parse = backend.parse_vocab
+    monkeypatch.setattr(backend, "parse_vocab", lambda *args: calls.append(args) or parse(*args))
+    assert backend.load_words(str(source), compiled) == ["crane", "slate", "tares"]
+    assert not calls
+
+    # same size, newer mtime: parsed again and recompiled
+    write_list(source, ["cigar", "crane", "tares"], 2_000_000_000)
+    assert backend.load_words(str(source), compiled) == ["cigar", "crane", "tares"]
+    assert len(calls) == 1
+    assert backend.load_words(str(source), compiled) == ["cigar", "crane", "tares"]
+    assert len(calls) == 1
+
+
+def test_damaged_compiled_list_is_ignored(tmp_path):
+    source = tmp_path / "words.txt"
+    compiled = tmp_path / "words.bin"
+    write_list(source, ["cigar", "crane"], 1_000_000_000)
+    stat = os.stat(source)
+    backend.compile_vocab(["cigar", "crane"], stat, str(compiled))
+    assert backend.load_compiled_vocab(stat, str(compiled)) == ["cigar", "crane"]
+    data = bytearray(compiled.read_bytes())
+    data[-1] = ord("x")  # the content hash no longer matches
+    compiled.write_bytes(bytes(data))
+    assert backend.load_compiled_vocab(stat, str(compiled)) is None
+    compiled.write_bytes(bytes(data[:-1]))
+    assert backend.load_compiled_vocab(stat, str(compiled)) is None
+    assert backend.load_compiled_vocab(stat, str(tmp_path / "missing.bin")) is None
@@ -0,0 +1,52 @@
+import random
+
+import backend
+import engine
+
+
+def test_hard_mode_error():
+    c = backend.Constraints()
+    c.add("crane", backend.Judge.evaluate("crane", "cigar"))
+    assert c.hard_mode_error("cigar") is None
+    assert c.hard_mode_error("caret") is None
+    assert c.hard_mode_error("stair") == "1st letter must be C"
+    assert c.hard_mode_error("cloud") == "Guess must contain A"
+    c.add("cider", backend.Judge.evaluate("cider", "cigar"))
+    assert c.hard_mode_error("cairn") == "2nd letter must be I"
+    assert c.hard_mode_error("ciaos") == "5th letter must be R"
+    assert c.hard_mode_error("cider") == "Guess must contain A"
+
+
+def test_hard_mode_error_counts_repeats():
+    c = backend.Constraints()
+    # three revealed Es: a guess with the two green ones only does not use them all
+    c.add("geese", backend.Judge.evaluate("geese", "eerie"))
+    assert c.hard_mode_error("beige") == "Guess must contain E"
+    assert c.hard_mode_error("eerie") is None
+
+
+
+
+def test_letter_index_matches_feedback():
+    rng = random.Random(3)
+    vocab = backend.Vocabulary(sorted({"".join(rng.choice("abcdeelst") for _ in range(5)) for _ in range(400)}))
+    for answer in vocab.words[::40]:
+        c = backend.Constraints()
+        history = []
+        for guess in vocab.words[7::97]:
+            states = backend.Judge.evaluate(guess, answer)
+            c.add(guess, states)
+            history.append((guess, states))
+            expected = [w for w in vocab.words if all(backend.Judge.evaluate(g, w) == s for g, s in history)]
+            got = [vocab[int(i)] for i in vocab.letters.indices(vocab.letters.matching(c))]
+            assert got == expected
+            assert vocab.letters.count(c) == len(expected)
+
+
+def test_hard_mode_game_rejects_unused_hints():
+    state = engine.GameState("cigar", ["cigar", "crane", "stair", "caret"], hard_mode=True)
+    assert state.guess("crane").ok
+    assert state.remaining() == 1  # caret has the grey E
+    result = state.guess("stair")
+    assert not result.ok and result.message == "1st letter must be C"
+    assert state.guess("caret").ok
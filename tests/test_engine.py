@@ -0,0 +1,41 @@
+import engine
+
+# every guess rules out only the word it names, so the game outlasts six rows
+WORDS = [f"zzzz{ch}" for ch in "abcdefghij"]
+
+
+def test_adversarial_game_has_no_row_limit_by_default():
+    state = engine.AdversarialGameState(WORDS)
+    for word in WORDS[:-1]:
+        assert state.guess(word).ok
+        assert not state.over
+    assert state.guess(WORDS[-1]).ok
+    assert state.win and state.row == len(WORDS) - 1
+
+
+def test_adversarial_game_can_be_given_rows():
+    state = engine.AdversarialGameState(WORDS, rows=engine.ROWS)
+    for word in WORDS[:engine.ROWS]:
+        state.guess(word)
+    assert state.lose
+
+
+def test_multi_board_game_is_won_once_every_board_is_solved():
+    state = engine.MultiGameState(["zzzzb", "zzzzd"], WORDS)
+    assert state.rows == engine.ROWS + 1
+    result = state.guess("zzzzd")
+    assert result.ok and state.solved == [None, 0] and not state.over
+    assert result.states[0] == [2, 2, 2, 2, 0]
+    result = state.guess("zzzzb")
+    # a solved board gets no more feedback
+    assert result.states == [[2] * 5, None]
+    assert state.win and state.solved == [1, 0]
+
+
+def test_multi_board_game_is_lost_when_the_rows_run_out():
+    state = engine.MultiGameState(["zzzza", "zzzzj"], WORDS, rows=3)
+    for word in ("zzzza", "zzzzb", "zzzzc"):
+        assert state.guess(word).ok
+    assert state.lose and not state.win
+    assert state.solved == [0, None]
+    assert not state.guess("zzzzj").ok
@@ -0,0 +1,43 @@
+import random
+
+import numpy as np
+
+import backend
+
+
+def random_words(rng, n, length=5, letters="abcdeelst"):
+    # a small alphabet makes repeated letters and shared letters common
+    return ["".join(rng.choice(letters) for _ in range(length)) for _ in range(n)]
+
+
+def test_evaluate_batch_matches_evaluate():
+    rng = random.Random(1)
+    for length in (4, 5, 6):
+        guesses = random_words(rng, 60, length) + ["eerie"[:length].ljust(length, "e")]
+        answers = random_words(rng, 70, length)
+        codes = backend.Judge.evaluate_batch(guesses, answers)
+        for i, guess in enumerate(guesses):
+            for j, answer in enumerate(answers):
+                expected = backend.pattern_code(backend.Judge.evaluate(guess, answer))
+                assert int(codes[i, j]) == expected, (guess, answer)
+
+
+def test_evaluate_repeated_letters():
+    assert backend.Judge.evaluate("geese", "eerie") == [0, 2, 1, 0, 2]
+    assert backend.Judge.evaluate("speed", "abide") == [0, 0, 1, 0, 1]
+    assert backend.Judge.evaluate("eerie", "eerie") == [2] * 5
+    codes = backend.Judge.evaluate_batch(["geese", "speed"], ["eerie", "abide"])
+    assert codes.dtype == np.uint8
+    assert backend.decode_pattern(codes[0, 0]) == [0, 2, 1, 0, 2]
+
+
+def test_hard_mode_mask_matches_hard_mode_error():
+    rng = random.Random(2)
+    words = random_words(rng, 300)
+    codes = backend.encode_words(words)
+    for answer in random_words(rng, 10):
+        c = backend.Constraints()
+        for guess in random_words(rng, 2):
+            c.add(guess, backend.Judge.evaluate(guess, answer))
+            mask = c.hard_mode_mask(codes)
+            assert mask.tolist() == [c.hard_mode_error(w) is None for w in words]
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import main  # noqa: E402
+
+
+def test_unknown_pack_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main.parse_args(["--pack", "no-such-pack"])
+    assert exc.value.code == 2
+    assert "unknown word pack 'no-such-pack'" in capsys.readouterr().err
+
+
+def test_known_pack_is_accepted():
+    assert main.parse_args(["--pack", "en"]).pack == "en"
+
+
+@pytest.mark.parametrize("value", ["x", "3"])
+def test_bad_wordle_boards_is_a_usage_error(monkeypatch, value):
+    monkeypatch.setenv("WORDLE_BOARDS", value)
+    with pytest.raises(SystemExit) as exc:
+        main.parse_args([])
+    assert exc.value.code == 2
+
+
+def test_wordle_boards_sets_the_default(monkeypatch):
+    monkeypatch.setenv("WORDLE_BOARDS", "4")
+    assert main.parse_args([]).boards == 4
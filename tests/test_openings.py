@@ -0,0 +1,39 @@
+import json
+
+import numpy as np
+
+import backend
+import openings
+import solver
+
+WORDS = ["bead", "beat", "dead", "deal", "heal", "heat", "lead", "teal"]
+
+
+def make_pack(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(backend, "PACKS_DIR", str(tmp_path / "packs"))
+    monkeypatch.setattr(backend, "_PACKS", None)
+    pack_dir = tmp_path / "packs" / "tiny"
+    pack_dir.mkdir(parents=True)
+    (pack_dir / "pack.json").write_text(json.dumps({"language": "en", "length": 4, "allowed": "words.json"}))
+    (pack_dir / "words.json").write_text(json.dumps(WORDS))
+    return backend.get_pack("tiny").vocabulary()
+
+
+def test_book_round_trip(tmp_path, monkeypatch):
+    vocab = make_pack(tmp_path, monkeypatch)
+    book = openings.get_opening_book(vocab)
+    assert book.opener in WORDS
+    stored = openings.load_opening_book(vocab.words)
+    assert (stored.opener, stored.replies, stored.vocab_hash) == (book.opener, book.replies, book.vocab_hash)
+    # every first-row pattern that can occur has a reply
+    codes = solver.Solver(vocab).partition(book.opener, np.arange(len(vocab)))
+    assert sorted(stored.replies) == sorted(int(c) for c in np.unique(codes))
+    assert openings.load_opening_book(vocab.words[:-1]) is None
+
+
+def test_main_on_a_small_pack(tmp_path, monkeypatch, capsys):
+    make_pack(tmp_path, monkeypatch)
+    assert openings.main(["--pack", "tiny"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("opener: ")
@@ -0,0 +1,55 @@
+import io
+import json
+
+import pytest
+
+import backend
+
+DOCUMENTS = [
+    '["crane", "slate","tares"]',
+    ' \n[ "a\\"b" , "caf\\u00e9",\n\t"x\\\\y", 12, -1.5e10, null, true, {"k": "v"}, ["nested"], "end" ] ',
+    '{"crane": 1, "slate": -1.5e10, "tares": {"n": [1, 2]}, "odd\\"key": "v", "last": 0.25}',
+    '[]',
+    '{}',
+]
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_iter_json_words_matches_json_load(doc):
+    data = json.loads(doc)
+    if isinstance(data, dict):
+        expected = list(data)
+    else:
+        expected = [item for item in data if isinstance(item, str)]
+    for chunk_size in range(1, 65):
+        assert list(backend.iter_json_words(io.StringIO(doc), chunk_size)) == expected, chunk_size
+
+
+def test_iter_json_words_rejects_other_documents():
+    with pytest.raises(ValueError):
+        list(backend.iter_json_words(io.StringIO('"crane"')))
+    with pytest.raises(ValueError):
+        list(backend.iter_json_words(io.StringIO('["crane", "sla'), chunk_size=4))
+
+
+def test_normalize_word_folds_accents():
+    assert backend.normalize_word(" Árbol\n") == "arbol"
+    assert backend.normalize_word("cañón") == "canon"
+    assert backend.normalize_word("straße") is None
+    assert backend.normalize_word("crane", length=4) is None
+
+
+def test_packs_are_read_from_manifests(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend, "CACHE_DIR", str(tmp_path / "cache"))
+    pack_dir = tmp_path / "packs" / "es4"
+    pack_dir.mkdir(parents=True)
+    (pack_dir / "pack.json").write_text(json.dumps(
+        {"language": "es", "length": 4, "allowed": "allowed.txt", "answers": "answers.json"}))
+    (pack_dir / "allowed.txt").write_text("casa\nÁrbol\nPERO\nniño\n", encoding="utf-8")
+    (pack_dir / "answers.json").write_text('{"mesa": 1, "casa": 2}', encoding="utf-8")
+    packs = backend.list_packs(str(tmp_path / "packs"))
+    assert list(packs) == [backend.DEFAULT_PACK, "es4"]
+    pack = packs["es4"]
+    assert (pack.language, pack.length) == ("es", 4)
+    assert sorted(pack.answer_words()) == ["casa", "mesa"]
+    assert sorted(pack.vocabulary().words) == ["casa", "mesa", "nino", "pero"]
@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+import recorder
+
+
+def test_late_header_fields_are_merged(tmp_path):
+    path = tmp_path / "session.jsonl"
+    rec = recorder.Recorder(str(path), seed=7)
+    rec.add_header(vocab="abc")
+    rec.game("crane")
+    rec.add_header(vocab="abc")
+    rec.close()
+    header, records = recorder.load_recording(str(path))
+    assert header == {"version": recorder.VERSION, "seed": 7, "vocab": "abc"}
+    assert [r["game"] for r in records] == ["crane"]
+
+
+def test_older_recordings_are_rejected(tmp_path):
+    path = tmp_path / "old.jsonl"
+    path.write_text(json.dumps({"version": 1, "seed": 7}) + "\n")
+    with pytest.raises(ValueError, match="version 1"):
+        recorder.load_recording(str(path))
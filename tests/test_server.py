@@ -0,0 +1,52 @@
+import json
+import asyncio
+
+import server
+
+WORDS = ["crane", "slate", "tares", "cigar"]
+
+
+def test_guesses_are_checked_before_they_are_judged():
+    game = server.GameServer(vocab=WORDS)
+    status, data = game.handle("POST", "/session", {"day": 0})
+    assert status == 201
+    session = game.sessions[data["id"]]
+    assert game.guess(session, 12345) == (400, {"error": "guess must be a string"})
+    assert game.guess(session, "cran") == (400, {"error": "Not enough letters"})
+    assert game.guess(session, "cranes") == (400, {"error": "Too many letters"})
+    assert game.guess(session, "crañe") == (400, {"error": "Only letters a-z are allowed"})
+    assert game.guess(session, "cr4ne") == (400, {"error": "Only letters a-z are allowed"})
+    assert game.guess(session, "ABCDE") == (400, {"error": "Not in word list"})
+    assert session.rows == 0
+    status, data = game.guess(session, "CRANE")
+    assert status == 200 and data["row"] == 1
+
+
+def test_day_must_be_an_integer():
+    game = server.GameServer(vocab=WORDS)
+    assert game.handle("POST", "/session", {"day": True})[0] == 400
+    assert game.handle("POST", "/session", {"day": "1"})[0] == 400
+    assert game.handle("POST", "/session", {"day": 1})[0] == 201
+
+
+async def exchange(request, limit):
+    game = server.GameServer(vocab=WORDS)
+    srv = await asyncio.start_server(game.serve_client, "127.0.0.1", 0, limit=limit)
+    port = srv.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    srv.close()
+    await srv.wait_closed()
+    return response
+
+
+def test_over_long_lines_get_431():
+    response = asyncio.run(exchange(b"GET /stats HTTP/1.1\r\nX-Pad: " + b"a" * 5000 + b"\r\n\r\n", 1024))
+    status, _, body = response.partition(b"\r\n\r\n")
+    assert status.startswith(b"HTTP/1.1 431 ")
+    assert json.loads(body) == {"error": "request line or header too long"}
+    response = asyncio.run(exchange(b"GET /" + b"a" * 5000 + b" HTTP/1.1\r\n\r\n", 1024))
+    assert response.startswith(b"HTTP/1.1 431 ")
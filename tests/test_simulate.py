@@ -0,0 +1,8 @@
+import simulate
+
+
+def test_hard_mode_simulation_plays_only_valid_guesses():
+    # used to stop with "Strategy played an invalid guess" once few candidates remained
+    simulate.init_worker(use_patterns=False, use_book=False)
+    histogram = simulate.run_worker(("entropy", 0, None, 100, True))
+    assert sum(histogram) == 100
@@ -0,0 +1,23 @@
+import backend
+import solver
+
+
+def test_hard_mode_suggestions_use_every_hint():
+    vocab = backend.get_vocabulary()
+    for answer in ("chump", "eerie", "fuzzy", "cigar", "sassy"):
+        s = solver.Solver(vocab)
+        constraints = backend.Constraints()
+        for guess in ("tares", "doily"):
+            states = backend.Judge.evaluate(guess, answer)
+            s.update(guess, states)
+            constraints.add(guess, states)
+            word = s.suggest(constraints)
+            assert constraints.hard_mode_error(word) is None, (answer, word)
+
+
+def test_first_suggestion_is_a_strong_opener():
+    s = solver.Solver(backend.get_vocabulary())
+    everything = s.candidates
+    word = s.suggest()
+    best = s.entropies([s.vocab.index_of("tares")], everything)[0]
+    assert s.entropies([s.vocab.index_of(word)], everything)[0] > best - 0.25
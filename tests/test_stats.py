@@ -0,0 +1,81 @@
+import pytest
+
+import stats
+
+
+GAMES = [
+    ("crane", ["tares", "crane"], True),
+    ("cigar", ["tares", "doily", "cloud", "pubco", "fjeld", "wimpy"], False),
+    ("eerie", ["geese", "eerie"], True),
+    ("slate", ["slate"], True),
+]
+
+
+def fields(s):
+    return (s.games, s.wins, s.streak, s.max_streak, s.histogram, s.letter_hits, s.letter_total)
+
+
+def rebuilt(games):
+    s = stats.Stats()
+    for answer, guesses, win in games:
+        s.add(answer, guesses, len(guesses) if win else 0)
+    return s
+
+
+def test_record_updates_aggregates(tmp_path):
+    store = stats.StatsStore(str(tmp_path))
+    for game in GAMES:
+        s = store.record(*game, when=0)
+    assert (s.games, s.wins, s.streak, s.max_streak) == (4, 3, 2, 2)
+    assert s.histogram == [1, 1, 2, 0, 0, 0, 0]
+    assert fields(s) == fields(rebuilt(GAMES))
+
+
+def test_reload_from_checkpoint(tmp_path):
+    store = stats.StatsStore(str(tmp_path))
+    for game in GAMES:
+        store.record(*game, when=0)
+    assert fields(stats.StatsStore(str(tmp_path)).stats) == fields(store.stats)
+
+
+def test_reload_folds_log_tail(tmp_path):
+    store = stats.StatsStore(str(tmp_path))
+    store.record(*GAMES[0], when=0)
+    checkpoint = (tmp_path / "stats.bin").read_bytes()
+    for game in GAMES[1:]:
+        store.record(*game, when=0)
+    # an older checkpoint: the records after it must come from the log
+    (tmp_path / "stats.bin").write_bytes(checkpoint)
+    reopened = stats.StatsStore(str(tmp_path))
+    assert reopened.offset == (tmp_path / "games.log").stat().st_size
+    assert fields(reopened.stats) == fields(rebuilt(GAMES))
+
+
+def test_missing_or_corrupt_checkpoint_rebuilds(tmp_path):
+    store = stats.StatsStore(str(tmp_path))
+    for game in GAMES:
+        store.record(*game, when=0)
+    (tmp_path / "stats.bin").write_bytes(b"garbage")
+    assert fields(stats.StatsStore(str(tmp_path)).stats) == fields(rebuilt(GAMES))
+    (tmp_path / "stats.bin").unlink()
+    assert fields(stats.StatsStore(str(tmp_path)).stats) == fields(rebuilt(GAMES))
+
+
+def test_partial_record_is_dropped(tmp_path):
+    store = stats.StatsStore(str(tmp_path))
+    store.record(*GAMES[0], when=0)
+    with open(tmp_path / "games.log", "ab") as f:
+        f.write(b"\x01\x02\x03")
+    reopened = stats.StatsStore(str(tmp_path))
+    assert (tmp_path / "games.log").stat().st_size == stats._RECORD.size
+    for game in GAMES[1:]:
+        reopened.record(*game, when=0)
+    assert fields(stats.StatsStore(str(tmp_path)).stats) == fields(rebuilt(GAMES))
+
+
+def test_unwritable_home_raises_oserror(tmp_path):
+    home = tmp_path / "file"
+    home.write_text("not a directory")
+    store = stats.StatsStore(str(home))
+    with pytest.raises(OSError):
+        store.record(*GAMES[0], when=0)
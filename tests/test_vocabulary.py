@@ -0,0 +1,43 @@
+import pytest
+
+import backend
+import engine
+
+WORDS = ["crane", "Crate", "cigar", "slate", "crane", "tares"]
+
+
+def test_vocabulary_membership_and_indices():
+    vocab = backend.Vocabulary(WORDS)
+    assert vocab.words == ("cigar", "crane", "crate", "slate", "tares")
+    assert len(vocab) == 5 and list(vocab) == list(vocab.words)
+    assert "crate" in vocab and "crat" not in vocab and "toast" not in vocab
+    for i, word in enumerate(vocab):
+        assert vocab.index_of(word) == i and vocab[i] == word
+    assert vocab.index_of("toast") is None
+
+
+def test_vocabulary_prefix_trie():
+    vocab = backend.Vocabulary(WORDS)
+    assert vocab.has_prefix("") and vocab.has_prefix("CR") and vocab.has_prefix("crate")
+    assert not vocab.has_prefix("cz") and not vocab.has_prefix("cranes")
+    assert vocab.next_letters("") == "cst"
+    assert vocab.next_letters("cra") == "nt"
+    assert vocab.next_letters("q") == ""
+
+
+def test_vocabulary_is_immutable_and_shared():
+    vocab = backend.Vocabulary(WORDS)
+    with pytest.raises(AttributeError):
+        vocab.words = ()
+    with pytest.raises(ValueError):
+        vocab.codes[0, 0] = 1
+    assert backend.get_vocabulary(reload=True) is backend.get_vocabulary()
+
+
+def test_game_flags_impossible_prefixes():
+    state = engine.GameState("crane", WORDS)
+    for ch in "crx":
+        state.add_char(ch)
+    assert not state.prefix_valid()
+    state.backspace()
+    assert state.prefix_valid()